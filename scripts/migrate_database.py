@@ -1,7 +1,19 @@
-"""Database migration script to add user_id column."""
+"""Database migration script for the scripts and users tables."""
 import sqlite3
 from pathlib import Path
 
+# Columns carried over when the scripts table is rebuilt
+SCRIPT_COLUMNS = ", ".join([
+    "id", "script_id", "user_id", "topic", "style", "duration",
+    "research_data", "sources", "title", "description", "keywords",
+    "full_script", "script_sections", "estimated_duration", "tone",
+    "target_audience", "tokens_used", "generation_time", "created_at",
+    "updated_at"
+])
+
+# UTC creation time with millisecond resolution, as declared on the model
+TIMESTAMP_DEFAULT = "STRFTIME('%Y-%m-%d %H:%M:%f', 'now')"
+
 # Database path
 db_path = Path(__file__).parent.parent / "data" / "scripts.db"
 
@@ -12,11 +24,16 @@ if not db_path.exists():
 
 print(f"Migrating database at {db_path}")
 
-# Connect to database
-conn = sqlite3.connect(db_path)
+# Connect in autocommit mode so the transaction below is managed explicitly
+conn = sqlite3.connect(db_path, isolation_level=None)
+conn.execute("PRAGMA journal_mode=WAL")
+conn.execute("PRAGMA synchronous=NORMAL")
 cursor = conn.cursor()
 
 try:
+    # Run every step in one transaction: a single fsync, all-or-nothing
+    cursor.execute("BEGIN IMMEDIATE")
+
     # Check if user_id column exists
     cursor.execute("PRAGMA table_info(scripts)")
     columns = [row[1] for row in cursor.fetchall()]
@@ -26,35 +43,79 @@ try:
     else:
         print("Adding user_id column to scripts table...")
         cursor.execute("ALTER TABLE scripts ADD COLUMN user_id INTEGER")
-        conn.commit()
         print("✅ Successfully added user_id column")
 
-    # Check if users table exists
-    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='users'")
-    if cursor.fetchone():
-        print("✅ Users table already exists")
-    else:
-        print("Creating users table...")
-        cursor.execute("""
-            CREATE TABLE users (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                email VARCHAR(255) UNIQUE NOT NULL,
-                username VARCHAR(100) UNIQUE NOT NULL,
-                hashed_password VARCHAR(255) NOT NULL,
-                is_active BOOLEAN DEFAULT 1,
-                is_superuser BOOLEAN DEFAULT 0,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    # Create users table if missing
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS users (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            email VARCHAR(255) UNIQUE NOT NULL,
+            username VARCHAR(100) UNIQUE NOT NULL,
+            hashed_password VARCHAR(255) NOT NULL,
+            is_active BOOLEAN DEFAULT 1,
+            is_superuser BOOLEAN DEFAULT 0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    print("✅ Users table ready")
+
+    # SQLite can't alter a column default, so rebuild the scripts table
+    # when its timestamps lack the millisecond database-side defaults
+    cursor.execute("PRAGMA table_info(scripts)")
+    created_at_default = {row[1]: row[4] for row in cursor.fetchall()}.get("created_at")
+
+    if created_at_default != TIMESTAMP_DEFAULT:
+        print("Rebuilding scripts table with database-generated timestamps...")
+        cursor.execute(f"""
+            CREATE TABLE scripts_new (
+                id INTEGER NOT NULL,
+                script_id VARCHAR(36) NOT NULL,
+                user_id INTEGER,
+                topic VARCHAR(500) NOT NULL,
+                style VARCHAR(50),
+                duration VARCHAR(50),
+                research_data JSON,
+                sources JSON,
+                title VARCHAR(200),
+                description TEXT,
+                keywords JSON,
+                full_script TEXT NOT NULL,
+                script_sections JSON,
+                estimated_duration VARCHAR(50),
+                tone VARCHAR(50),
+                target_audience VARCHAR(200),
+                tokens_used INTEGER,
+                generation_time FLOAT,
+                created_at DATETIME DEFAULT ({TIMESTAMP_DEFAULT}) NOT NULL,
+                updated_at DATETIME DEFAULT ({TIMESTAMP_DEFAULT}),
+                PRIMARY KEY (id),
+                FOREIGN KEY(user_id) REFERENCES users (id)
             )
         """)
-        conn.commit()
-        print("✅ Successfully created users table")
+        cursor.execute(f"""
+            INSERT INTO scripts_new ({SCRIPT_COLUMNS})
+            SELECT {SCRIPT_COLUMNS} FROM scripts
+        """)
+        cursor.execute("DROP TABLE scripts")
+        cursor.execute("ALTER TABLE scripts_new RENAME TO scripts")
+        cursor.execute("CREATE INDEX ix_scripts_id ON scripts (id)")
+        cursor.execute("CREATE UNIQUE INDEX ix_scripts_script_id ON scripts (script_id)")
+        print("✅ Scripts table rebuilt")
+
+    # Index used by recent-script listings and date-range analytics
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS ix_scripts_created_at ON scripts (created_at)"
+    )
+    print("✅ created_at index ready")
 
+    cursor.execute("COMMIT")
     print("\n✅ Migration completed successfully!")
 
 except Exception as e:
     print(f"❌ Migration failed: {e}")
-    conn.rollback()
+    if conn.in_transaction:
+        cursor.execute("ROLLBACK")
     raise
 
 finally:
@@ -0,0 +1,124 @@
+"""Database migration script for PostgreSQL deployments.
+
+Sets the scripts timestamps to default to UTC instead of the session time
+zone. research_data, sources and script_sections used to be JSON columns
+and now hold zlib-compressed JSON as bytea; this converts the columns and
+compresses the existing rows. Everything runs in one transaction. SQLite
+databases are migrated by migrate_database.py instead.
+"""
+import asyncio
+import sys
+import zlib
+from pathlib import Path
+
+# Run from anywhere: make the src package importable
+ROOT = Path(__file__).parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from sqlalchemy import bindparam, text  # noqa: E402
+
+from src.models.database import JSON_COMPRESSION_LEVEL, engine  # noqa: E402
+
+# Columns stored as CompressedJSON on the scripts table
+COMPRESSED_COLUMNS = ("research_data", "sources", "script_sections")
+
+# Columns filled with the database's UTC time on insert
+TIMESTAMP_COLUMNS = ("created_at", "updated_at")
+
+# Rows read and rewritten per round trip during the backfill
+BACKFILL_BATCH_SIZE = 500
+
+
+async def migrate():
+    """Set UTC timestamp defaults, then compress the JSON columns."""
+    if engine.dialect.name != "postgresql":
+        print(f"Database is {engine.dialect.name}, not PostgreSQL")
+        print("Run scripts/migrate_database.py for SQLite databases")
+        return
+
+    async with engine.begin() as conn:
+        for column in TIMESTAMP_COLUMNS:
+            await conn.execute(text(
+                f"ALTER TABLE scripts ALTER COLUMN {column} "
+                "SET DEFAULT TIMEZONE('utc', CURRENT_TIMESTAMP)"
+            ))
+        print("✅ Timestamps default to UTC")
+
+        result = await conn.execute(
+            text(
+                "SELECT column_name FROM information_schema.columns "
+                "WHERE table_schema = current_schema() AND table_name = 'scripts' "
+                "AND column_name IN :columns AND data_type <> 'bytea'"
+            ).bindparams(bindparam("columns", expanding=True)),
+            {"columns": list(COMPRESSED_COLUMNS)}
+        )
+        columns = [row[0] for row in result]
+
+        if not columns:
+            print("✅ JSON columns already compressed")
+        else:
+            await compress_columns(conn, columns)
+
+    print("\n✅ Migration completed successfully!")
+
+
+async def compress_columns(conn, columns):
+    """Convert JSON columns to bytea and compress every row in them."""
+    # Keep the JSON text as UTF-8 bytes, then compress it below
+    for column in columns:
+        print(f"Converting scripts.{column} to bytea...")
+        await conn.execute(text(
+            f"ALTER TABLE scripts ALTER COLUMN {column} TYPE bytea "
+            f"USING convert_to({column}::text, 'UTF8')"
+        ))
+
+    select_rows = text(
+        f"SELECT id, {', '.join(columns)} FROM scripts "
+        "WHERE id > :last_id ORDER BY id LIMIT :limit"
+    )
+    update_row = text(
+        f"UPDATE scripts SET {', '.join(f'{c} = :{c}' for c in columns)} "
+        "WHERE id = :id"
+    )
+
+    last_id = 0
+    migrated = 0
+    while True:
+        rows = (
+            await conn.execute(
+                select_rows, {"last_id": last_id, "limit": BACKFILL_BATCH_SIZE}
+            )
+        ).mappings().all()
+        if not rows:
+            break
+
+        await conn.execute(update_row, [
+            {
+                "id": row["id"],
+                **{
+                    c: zlib.compress(row[c], JSON_COMPRESSION_LEVEL)
+                    if row[c] is not None else None
+                    for c in columns
+                }
+            }
+            for row in rows
+        ])
+        last_id = rows[-1]["id"]
+        migrated += len(rows)
+
+    print(f"✅ Compressed {migrated} rows")
+
+
+async def main():
+    try:
+        await migrate()
+    except Exception as e:
+        print(f"❌ Migration failed: {e}")
+        raise
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
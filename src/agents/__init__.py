@@ -1,6 +1,19 @@
 """Agent modules."""
-from src.agents.base import ClaudeAgent
-from src.agents.researcher import ResearchAgent
-from src.agents.scriptwriter import ScriptwriterAgent
+from importlib import import_module
+
+# Agents load on first access so only the configured provider's SDK is imported
+_LAZY_IMPORTS = {
+    "ClaudeAgent": "src.agents.base",
+    "ResearchAgent": "src.agents.researcher",
+    "ScriptwriterAgent": "src.agents.scriptwriter",
+}
 
 __all__ = ["ClaudeAgent", "ResearchAgent", "ScriptwriterAgent"]
+
+
+def __getattr__(name):
+    """Import agent classes lazily (PEP 562)."""
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module), name)
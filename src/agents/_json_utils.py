@@ -0,0 +1,28 @@
+"""Helpers for pulling JSON payloads out of model responses."""
+import re
+
+# A JSON object inside a markdown code fence, with or without a language tag.
+# Non-greedy, so only the first fenced block is taken when there are several
+_JSON_FENCE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.S)
+
+
+def extract_json(content: str) -> str:
+    """
+    Extract the JSON object text from a model response.
+
+    Args:
+        content: Raw response text, possibly wrapped in a code fence
+
+    Returns:
+        The JSON object text, or the stripped content if none is found
+    """
+    match = _JSON_FENCE.search(content)
+    if match:
+        return match.group(1)
+
+    start = content.find("{")
+    end = content.rfind("}")
+    if start != -1 and end > start:
+        return content[start:end + 1]
+
+    return content.strip()
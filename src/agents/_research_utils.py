@@ -0,0 +1,65 @@
+"""Helpers shared by the research agents for fanned-out deep research."""
+from typing import Any, Dict, List
+
+# Angles researched in parallel for "deep" requests and merged afterwards
+DEEP_RESEARCH_FOCUSES = (
+    "Core facts, background and expert perspectives",
+    "Statistics, data points and recent studies",
+    "Current trends, news and open debates"
+)
+
+# Research fields that are concatenated when merging parallel results
+MERGED_LIST_FIELDS = ("key_findings", "statistics", "trending_angles", "hook_ideas")
+
+
+def merge_research(topic: str, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Merge parallel research results, dropping duplicate entries.
+
+    Args:
+        topic: The research topic
+        results: Research dicts, one per focus area
+
+    Returns:
+        A single research dict; the first result if none parsed cleanly
+    """
+    parsed = [r for r in results if "error" not in r]
+    if not parsed:
+        return results[0]
+
+    merged = {
+        "topic": parsed[0].get("topic", topic),
+        "research_summary": " ".join(
+            r["research_summary"] for r in parsed if r.get("research_summary")
+        )
+    }
+
+    for field in MERGED_LIST_FIELDS:
+        values = []
+        for result in parsed:
+            for value in result.get(field, []):
+                if value not in values:
+                    values.append(value)
+        merged[field] = values
+
+    sources = []
+    seen_sources = set()
+    for result in parsed:
+        for source in result.get("sources", []):
+            key = source.get("url") or source.get("title")
+            if key not in seen_sources:
+                seen_sources.add(key)
+                sources.append(source)
+    merged["sources"] = sources
+
+    # Only provider-backed results carry usage metadata
+    metas = [r["_meta"] for r in parsed if "_meta" in r]
+    if metas:
+        merged["_meta"] = {
+            "tokens_used": {
+                "input_tokens": sum(m["tokens_used"].get("input_tokens", 0) for m in metas),
+                "output_tokens": sum(m["tokens_used"].get("output_tokens", 0) for m in metas)
+            },
+            "stop_reason": metas[-1]["stop_reason"]
+        }
+    return merged
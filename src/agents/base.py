@@ -1,15 +1,25 @@
 """Base Claude agent with tool use capabilities."""
-from typing import Any, Dict, List, Optional
-from anthropic import Anthropic
+import asyncio
+from contextlib import suppress
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
+from anthropic import AsyncAnthropic
+from src.agents.http import ASYNC_HTTPX
+from src.agents.result import GenerateResult
 from src.config import settings
 
 
 class ClaudeAgent:
     """Base agent for Claude API interactions."""
 
+    # Seconds between status checks of a submitted message batch
+    BATCH_POLL_INTERVAL = 30
+
     def __init__(self):
         """Initialize Claude client."""
-        self.client = Anthropic(api_key=settings.ANTHROPIC_API_KEY)
+        self.client = AsyncAnthropic(
+            api_key=settings.ANTHROPIC_API_KEY,
+            http_client=ASYNC_HTTPX
+        )
         self.model = settings.CLAUDE_MODEL
         self.max_tokens = settings.MAX_TOKENS
 
@@ -19,7 +29,7 @@ class ClaudeAgent:
         user_message: str,
         temperature: float = 1.0,
         tools: Optional[List[Dict[str, Any]]] = None
-    ) -> Dict[str, Any]:
+    ) -> GenerateResult:
         """
         Generate a response from Claude.
 
@@ -30,50 +40,170 @@ class ClaudeAgent:
             tools: Optional list of tools for the agent to use
 
         Returns:
-            Response dict with content and optional tool usage
+            GenerateResult with content and optional tool usage
         """
         try:
-            kwargs = {
-                "model": self.model,
-                "max_tokens": self.max_tokens,
-                "temperature": temperature,
-                "system": system_prompt,
-                "messages": [{"role": "user", "content": user_message}]
-            }
+            kwargs = self._build_request(system_prompt, user_message, temperature)
 
             if tools:
                 kwargs["tools"] = tools
 
-            response = self.client.messages.create(**kwargs)
+            response = await self.client.messages.create(**kwargs)
+            content, tool_calls = self._extract(response, collect_tools=bool(tools))
 
-            return {
-                "content": self._extract_content(response),
-                "stop_reason": response.stop_reason,
-                "usage": {
+            return GenerateResult(
+                content=content,
+                stop_reason=response.stop_reason,
+                usage={
                     "input_tokens": response.usage.input_tokens,
                     "output_tokens": response.usage.output_tokens
                 },
-                "tool_calls": self._extract_tool_calls(response) if tools else None
-            }
+                tool_calls=tool_calls
+            )
 
         except Exception as e:
             raise RuntimeError(f"Claude API error: {str(e)}")
 
-    def _extract_content(self, response) -> str:
-        """Extract text content from response."""
-        for block in response.content:
-            if block.type == "text":
-                return block.text
-        return ""
+    async def generate_stream(
+        self,
+        system_prompt: str,
+        user_message: str,
+        temperature: float = 1.0
+    ) -> AsyncIterator[Union[str, GenerateResult]]:
+        """
+        Stream a response from Claude.
+
+        Args:
+            system_prompt: System instructions for the agent
+            user_message: User's input message
+            temperature: Sampling temperature (0-1)
+
+        Yields:
+            Text deltas as they arrive, then the complete GenerateResult
+        """
+        try:
+            kwargs = self._build_request(system_prompt, user_message, temperature)
+
+            async with self.client.messages.stream(**kwargs) as stream:
+                async for text in stream.text_stream:
+                    yield text
+                response = await stream.get_final_message()
+            content, _ = self._extract(response, collect_tools=False)
+
+            yield GenerateResult(
+                content=content,
+                stop_reason=response.stop_reason,
+                usage={
+                    "input_tokens": response.usage.input_tokens,
+                    "output_tokens": response.usage.output_tokens
+                },
+                tool_calls=None
+            )
+
+        except Exception as e:
+            raise RuntimeError(f"Claude API error: {str(e)}")
+
+    async def generate_batch(
+        self,
+        requests: List[Tuple[str, str, float]]
+    ) -> List[Union[GenerateResult, Exception]]:
+        """
+        Run many requests through the Message Batches API.
+
+        Batches are billed at half price and don't count against the
+        regular rate limits, but may take up to 24 hours to finish. If
+        this call is cancelled while waiting, the batch is cancelled too.
+
+        Args:
+            requests: (system_prompt, user_message, temperature) per request
+
+        Returns:
+            A GenerateResult or the error for each request, in input order
+        """
+        try:
+            batch = await self.client.messages.batches.create(requests=[
+                {"custom_id": str(i), "params": self._build_request(*request)}
+                for i, request in enumerate(requests)
+            ])
+
+            try:
+                while batch.processing_status != "ended":
+                    await asyncio.sleep(self.BATCH_POLL_INTERVAL)
+                    batch = await self.client.messages.batches.retrieve(batch.id)
+            except asyncio.CancelledError:
+                # Nobody will collect the results, so stop paying for them
+                with suppress(Exception):
+                    await self.client.messages.batches.cancel(batch.id)
+                raise
+
+            results: List[Union[GenerateResult, Exception]] = [
+                RuntimeError("Claude API error: missing batch result")
+                for _ in requests
+            ]
+            async for entry in await self.client.messages.batches.results(batch.id):
+                index = int(entry.custom_id)
+                if entry.result.type != "succeeded":
+                    results[index] = RuntimeError(f"Claude API error: batch request {entry.result.type}")
+                    continue
+
+                message = entry.result.message
+                content, _ = self._extract(message, collect_tools=False)
+                results[index] = GenerateResult(
+                    content=content,
+                    stop_reason=message.stop_reason,
+                    usage={
+                        "input_tokens": message.usage.input_tokens,
+                        "output_tokens": message.usage.output_tokens
+                    },
+                    tool_calls=None
+                )
+            return results
 
-    def _extract_tool_calls(self, response) -> List[Dict[str, Any]]:
-        """Extract tool use calls from response."""
-        tool_calls = []
+        except Exception as e:
+            raise RuntimeError(f"Claude API error: {str(e)}")
+
+    def _build_request(
+        self,
+        system_prompt: str,
+        user_message: str,
+        temperature: float
+    ) -> Dict[str, Any]:
+        """Build Messages API request arguments."""
+        return {
+            "model": self.model,
+            "max_tokens": self.max_tokens,
+            "temperature": temperature,
+            # Mark the static system prompt as a cacheable prefix so repeat
+            # calls skip reprocessing it on the server
+            "system": [{
+                "type": "text",
+                "text": system_prompt,
+                "cache_control": {"type": "ephemeral"}
+            }],
+            "messages": [{"role": "user", "content": user_message}]
+        }
+
+    def _extract(
+        self,
+        response,
+        collect_tools: bool = True
+    ) -> Tuple[str, Optional[List[Dict[str, Any]]]]:
+        """
+        Extract text content and tool use calls in one pass over the response.
+
+        Tool calls are only gathered when collect_tools is set; otherwise
+        None is returned in their place.
+        """
+        text_parts = []
+        tool_calls = [] if collect_tools else None
         for block in response.content:
-            if block.type == "tool_use":
+            block_type = block.type
+            if block_type == "text":
+                text_parts.append(block.text)
+            elif block_type == "tool_use" and collect_tools:
                 tool_calls.append({
                     "id": block.id,
                     "name": block.name,
                     "input": block.input
                 })
-        return tool_calls
+        return "".join(text_parts), tool_calls
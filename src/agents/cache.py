@@ -0,0 +1,188 @@
+"""In-process TTL/LRU cache for agent results."""
+import asyncio
+import copy
+import hashlib
+import inspect
+import json
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+# Seconds a cached result stays fresh, per kind of agent call
+CACHE_TTLS = {
+    "research": 24 * 60 * 60,
+    "script": 60 * 60
+}
+
+DEFAULT_MAXSIZE = 500
+
+# Tasks for calls currently in flight, shared by identical concurrent callers
+_inflight: Dict[str, asyncio.Future] = {}
+
+
+class TTLCache:
+    """Least-recently-used cache whose entries expire after a fixed TTL."""
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE, ttl: float = 3600):
+        """Initialize an empty cache."""
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return a fresh cached value, or default on miss/expiry."""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return default
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: str, default: Any = None) -> Any:
+        """Remove a key and return its value."""
+        entry = self._data.pop(key, None)
+        return entry[1] if entry else default
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def make_key(namespace: str, **params: Any) -> str:
+    """Build a stable hash key from a namespace and call arguments."""
+    payload = json.dumps({"fn": namespace, **params}, sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def normalize_topic(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Key normalizer so topics differing only in case or padding share an entry."""
+    params["topic"] = " ".join(params["topic"].split()).lower()
+    return params
+
+
+def normalize_research(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Key normalizer leaving usage metadata out, so cached research still hits."""
+    research_data = params["research_data"]
+    if isinstance(research_data, dict) and "_meta" in research_data:
+        params["research_data"] = {k: v for k, v in research_data.items() if k != "_meta"}
+    return params
+
+
+async def coalesce(key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Run factory() once for all concurrent callers with the same key.
+
+    The call runs as a detached task that no single caller owns, so a
+    cancelled caller never cancels the result the others are waiting on.
+
+    Args:
+        key: Identity of the call
+        factory: Zero-argument coroutine function producing the result
+
+    Returns:
+        The result shared by every caller that joined the in-flight call
+    """
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(factory())
+        _inflight[key] = task
+        task.add_done_callback(lambda done: _forget_inflight(key, done))
+    return await asyncio.shield(task)
+
+
+def _forget_inflight(key: str, task: asyncio.Future) -> None:
+    """Drop a finished in-flight call, marking its exception as retrieved."""
+    if _inflight.get(key) is task:
+        del _inflight[key]
+    if not task.cancelled():
+        # Avoid "exception was never retrieved" when every caller went away
+        task.exception()
+
+
+def _as_cache_hit(result: Any) -> Any:
+    """Copy a shared result, zeroing its usage as no provider call was made for it."""
+    result = copy.deepcopy(result)
+    meta = result.get("_meta")
+    if isinstance(meta, dict):
+        meta["cached"] = True
+        meta["tokens_used"] = {"input_tokens": 0, "output_tokens": 0}
+    return result
+
+
+def cached(
+    namespace: str,
+    ttl: Optional[float] = None,
+    maxsize: int = DEFAULT_MAXSIZE,
+    normalize: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None
+) -> Callable:
+    """
+    Cache an async agent method by a hash of its arguments.
+
+    Concurrent identical calls share a single in-flight request. Results
+    carrying an "error" key are not cached. Pass fresh=True to skip the
+    lookup and replace the cached entry with a new result.
+
+    Only the caller that made the provider call sees its token usage;
+    cache hits and callers joining an in-flight request get _meta marked
+    "cached" with zero tokens, so spend is never counted twice.
+
+    Args:
+        namespace: Key namespace, also selects the default TTL
+        ttl: Seconds before an entry expires
+        maxsize: Maximum number of cached entries
+        normalize: Optional hook rewriting the bound arguments before hashing
+
+    Returns:
+        Method decorator
+    """
+    def decorator(func: Callable) -> Callable:
+        cache = TTLCache(maxsize=maxsize, ttl=ttl or CACHE_TTLS[namespace])
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        async def wrapper(self, *args: Any, fresh: bool = False, **kwargs: Any) -> Any:
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            params = dict(bound.arguments)
+            del params["self"]
+            if normalize:
+                params = normalize(params)
+            key = make_key(f"{type(self).__name__}.{namespace}", **params)
+
+            async def load() -> Any:
+                result = await func(self, *args, **kwargs)
+                if "error" not in result:
+                    cache.set(key, result)
+                return result
+
+            if fresh:
+                return copy.deepcopy(await load())
+
+            # Callers get their own copy so mutations never reach the cache
+            hit = cache.get(key)
+            if hit is not None:
+                return _as_cache_hit(hit)
+            if key in _inflight:
+                return _as_cache_hit(await coalesce(key, load))
+            return copy.deepcopy(await coalesce(key, load))
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
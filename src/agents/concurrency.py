@@ -0,0 +1,29 @@
+"""Helpers for running independent LLM calls concurrently."""
+import asyncio
+from typing import Any, Awaitable, Iterable, List
+
+# Upper bound on in-flight provider calls fanned out from a single request
+MAX_CONCURRENT_CALLS = 5
+
+
+async def gather_bounded(
+    coros: Iterable[Awaitable[Any]],
+    limit: int = MAX_CONCURRENT_CALLS
+) -> List[Any]:
+    """
+    Await coroutines concurrently with at most `limit` running at once.
+
+    Args:
+        coros: Coroutines to run
+        limit: Maximum number of coroutines awaited at the same time
+
+    Returns:
+        Results in the same order as the input coroutines
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(coro: Awaitable[Any]) -> Any:
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(*(run(coro) for coro in coros))
@@ -0,0 +1,16 @@
+"""Shared HTTP connection pool for the AI provider SDK clients."""
+import httpx
+
+# Every agent instance hands this client to its SDK so all generate() calls
+# reuse persistent keep-alive connections instead of re-handshaking TLS.
+ASYNC_HTTPX = httpx.AsyncClient(
+    # Sized for bulk and deep-research fan-out; over HTTP/2 many of these
+    # requests share a handful of multiplexed connections
+    limits=httpx.Limits(
+        max_connections=100,
+        max_keepalive_connections=100,
+        keepalive_expiry=30.0
+    ),
+    timeout=httpx.Timeout(60.0, connect=10.0),
+    http2=True
+)
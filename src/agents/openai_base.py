@@ -1,15 +1,30 @@
 """OpenAI agent with similar interface to Claude agent."""
-from typing import Any, Dict, List, Optional
-from openai import OpenAI
+import asyncio
+from contextlib import suppress
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
+import orjson
+from openai import AsyncOpenAI
+from src.agents.http import ASYNC_HTTPX
+from src.agents.result import GenerateResult
 from src.config import settings
 
 
+# Batch states after which no more results will appear
+_BATCH_DONE = frozenset({"completed", "failed", "expired", "cancelled"})
+
+
 class OpenAIAgent:
     """Base agent for OpenAI API interactions."""
 
+    # Seconds between status checks of a submitted batch
+    BATCH_POLL_INTERVAL = 30
+
     def __init__(self):
         """Initialize OpenAI client."""
-        self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
+        self.client = AsyncOpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            http_client=ASYNC_HTTPX
+        )
         self.model = settings.OPENAI_MODEL
         self.max_tokens = settings.MAX_TOKENS
 
@@ -19,7 +34,7 @@ class OpenAIAgent:
         user_message: str,
         temperature: float = 1.0,
         tools: Optional[List[Dict[str, Any]]] = None
-    ) -> Dict[str, Any]:
+    ) -> GenerateResult:
         """
         Generate a response from OpenAI.
 
@@ -30,30 +45,174 @@ class OpenAIAgent:
             tools: Optional list of tools (not used for now)
 
         Returns:
-            Response dict with content and usage
+            GenerateResult with content and usage
         """
         try:
-            messages = [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_message}
-            ]
-
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model=self.model,
-                messages=messages,
+                messages=self._build_messages(system_prompt, user_message),
                 temperature=temperature,
                 max_tokens=self.max_tokens
             )
 
-            return {
-                "content": response.choices[0].message.content,
-                "stop_reason": response.choices[0].finish_reason,
-                "usage": {
+            return GenerateResult(
+                content=response.choices[0].message.content,
+                stop_reason=response.choices[0].finish_reason,
+                usage={
                     "input_tokens": response.usage.prompt_tokens,
                     "output_tokens": response.usage.completion_tokens
                 },
-                "tool_calls": None
-            }
+                tool_calls=None
+            )
+
+        except Exception as e:
+            raise RuntimeError(f"OpenAI API error: {str(e)}")
+
+    async def generate_stream(
+        self,
+        system_prompt: str,
+        user_message: str,
+        temperature: float = 1.0
+    ) -> AsyncIterator[Union[str, GenerateResult]]:
+        """
+        Stream a response from OpenAI.
+
+        Args:
+            system_prompt: System instructions for the agent
+            user_message: User's input message
+            temperature: Sampling temperature (0-2)
+
+        Yields:
+            Text deltas as they arrive, then the complete GenerateResult
+        """
+        try:
+            stream = await self.client.chat.completions.create(
+                model=self.model,
+                messages=self._build_messages(system_prompt, user_message),
+                temperature=temperature,
+                max_tokens=self.max_tokens,
+                stream=True,
+                stream_options={"include_usage": True}
+            )
+
+            content = []
+            finish_reason = None
+            usage = None
+            async for chunk in stream:
+                if chunk.usage:
+                    usage = chunk.usage
+                if not chunk.choices:
+                    continue
+
+                choice = chunk.choices[0]
+                if choice.delta.content:
+                    content.append(choice.delta.content)
+                    yield choice.delta.content
+                if choice.finish_reason:
+                    finish_reason = choice.finish_reason
+
+            yield GenerateResult(
+                content="".join(content),
+                stop_reason=finish_reason,
+                usage={
+                    "input_tokens": usage.prompt_tokens if usage else 0,
+                    "output_tokens": usage.completion_tokens if usage else 0
+                },
+                tool_calls=None
+            )
+
+        except Exception as e:
+            raise RuntimeError(f"OpenAI API error: {str(e)}")
+
+    async def generate_batch(
+        self,
+        requests: List[Tuple[str, str, float]]
+    ) -> List[Union[GenerateResult, Exception]]:
+        """
+        Run many requests through the Batch API.
+
+        Batches are billed at half price and don't count against the
+        regular rate limits, but may take up to 24 hours to finish. If
+        this call is cancelled while waiting, the batch is cancelled too.
+
+        Args:
+            requests: (system_prompt, user_message, temperature) per request
+
+        Returns:
+            A GenerateResult or the error for each request, in input order
+        """
+        try:
+            lines = b"\n".join(
+                orjson.dumps({
+                    "custom_id": str(i),
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": self.model,
+                        "messages": self._build_messages(system_prompt, user_message),
+                        "temperature": temperature,
+                        "max_tokens": self.max_tokens
+                    }
+                })
+                for i, (system_prompt, user_message, temperature) in enumerate(requests)
+            )
+            input_file = await self.client.files.create(
+                file=("batch.jsonl", lines),
+                purpose="batch"
+            )
+            batch = await self.client.batches.create(
+                input_file_id=input_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+
+            try:
+                while batch.status not in _BATCH_DONE:
+                    await asyncio.sleep(self.BATCH_POLL_INTERVAL)
+                    batch = await self.client.batches.retrieve(batch.id)
+            except asyncio.CancelledError:
+                # Nobody will collect the results, so stop paying for them
+                with suppress(Exception):
+                    await self.client.batches.cancel(batch.id)
+                raise
+
+            results: List[Union[GenerateResult, Exception]] = [
+                RuntimeError(f"OpenAI API error: batch {batch.status}")
+                for _ in requests
+            ]
+            if not batch.output_file_id:
+                return results
+
+            output = await self.client.files.content(batch.output_file_id)
+            for line in output.content.splitlines():
+                entry = orjson.loads(line)
+                index = int(entry["custom_id"])
+                response = entry.get("response") or {}
+                if response.get("status_code") != 200:
+                    results[index] = RuntimeError(f"OpenAI API error: {entry.get('error')}")
+                    continue
+
+                body = response["body"]
+                choice = body["choices"][0]
+                results[index] = GenerateResult(
+                    content=choice["message"]["content"],
+                    stop_reason=choice["finish_reason"],
+                    usage={
+                        "input_tokens": body["usage"]["prompt_tokens"],
+                        "output_tokens": body["usage"]["completion_tokens"]
+                    },
+                    tool_calls=None
+                )
+            return results
 
         except Exception as e:
             raise RuntimeError(f"OpenAI API error: {str(e)}")
+
+    def _build_messages(self, system_prompt: str, user_message: str) -> List[Dict[str, str]]:
+        """Build the chat messages for a request."""
+        # The system prompt stays the first message so OpenAI's automatic
+        # prompt caching can reuse it as a shared prefix across calls
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_message}
+        ]
@@ -0,0 +1,37 @@
+"""Client-side rate limiting for provider calls."""
+import asyncio
+import time
+
+# Requests per second allowed through the shared provider bucket
+PROVIDER_RATE_LIMIT = 10
+
+
+class TokenBucket:
+    """Async token bucket allowing `rate` acquisitions per second on average."""
+
+    def __init__(self, rate: float, capacity: float = None):
+        """
+        Initialize the bucket full.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size (defaults to rate)
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    async def acquire(self) -> None:
+        """Take one token, sleeping until it is available."""
+        # Reserve the token before awaiting: nothing else runs on the event
+        # loop in between, so concurrent callers queue up without a lock
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.rate)
+
+
+provider_bucket = TokenBucket(PROVIDER_RATE_LIMIT)
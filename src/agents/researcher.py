@@ -1,12 +1,29 @@
 """Research agent with web search synthesis."""
-from typing import Dict, List, Any
-from src.agents.base import ClaudeAgent
-from src.agents.openai_base import OpenAIAgent
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, Final, Mapping
+import orjson
+from src.agents._json_utils import extract_json
+from src.agents._research_utils import DEEP_RESEARCH_FOCUSES, merge_research
+from src.agents.cache import cached, normalize_topic
+from src.agents.concurrency import gather_bounded
+from src.agents.ratelimit import provider_bucket
+from src.agents.result import GenerateResult
 from src.config import settings
 
 
-# Select the appropriate base class based on configuration
-BaseAgent = OpenAIAgent if settings.AI_PROVIDER == "openai" else ClaudeAgent
+# Select the appropriate base class based on configuration, importing only
+# the SDK of the configured provider
+if settings.AI_PROVIDER == "openai":
+    from src.agents.openai_base import OpenAIAgent as BaseAgent
+else:
+    from src.agents.base import ClaudeAgent as BaseAgent
+
+
+_DEPTH_INSTRUCTIONS: Final[Mapping[str, str]] = MappingProxyType({
+    "quick": "Focus on 2-3 top sources with key highlights",
+    "medium": "Gather 4-6 diverse sources with comprehensive analysis",
+    "deep": "Conduct extensive research with 8-10 sources, detailed fact-checking"
+})
 
 
 class ResearchAgent(BaseAgent):
@@ -46,10 +63,18 @@ Focus on:
 - Engaging angles for video content
 """
 
+    # Sources per validation call and validation calls in flight at once
+    VALIDATION_CHUNK_SIZE = 5
+    VALIDATION_CONCURRENCY = 4
+
+    @cached("research", normalize=normalize_topic)
     async def research_topic(self, topic: str, depth: str = "medium") -> Dict[str, Any]:
         """
         Research a topic and synthesize findings.
 
+        Deep research fans out one request per focus area concurrently and
+        merges the findings into a single result.
+
         Args:
             topic: The research topic
             depth: Research depth (quick|medium|deep)
@@ -57,18 +82,30 @@ Focus on:
         Returns:
             Research findings dict
         """
-        depth_instructions = {
-            "quick": "Focus on 2-3 top sources with key highlights",
-            "medium": "Gather 4-6 diverse sources with comprehensive analysis",
-            "deep": "Conduct extensive research with 8-10 sources, detailed fact-checking"
-        }
+        if depth != "deep":
+            return await self._research(topic, depth)
+
+        results = await gather_bounded(
+            (self._research(topic, depth, focus=focus) for focus in DEEP_RESEARCH_FOCUSES),
+            limit=settings.RESEARCH_CONCURRENCY
+        )
+        return merge_research(topic, results)
+
+    async def _research(
+        self,
+        topic: str,
+        depth: str,
+        focus: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Run a single research request and parse its JSON findings."""
+        focus_section = f"\nResearch Focus: {focus}\n" if focus else ""
 
         user_message = f"""Research the following topic for a YouTube video:
 
 Topic: {topic}
 
-Research Depth: {depth} - {depth_instructions.get(depth, depth_instructions['medium'])}
-
+Research Depth: {depth} - {_DEPTH_INSTRUCTIONS.get(depth, _DEPTH_INSTRUCTIONS['medium'])}
+{focus_section}
 Provide comprehensive research findings in the specified JSON format.
 Ensure all statistics and claims include source attribution.
 """
@@ -80,29 +117,24 @@ Ensure all statistics and claims include source attribution.
         )
 
         # Parse JSON response
-        import json
         try:
             # Extract JSON from response (handle markdown code blocks)
-            content = response["content"]
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0].strip()
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0].strip()
+            content = extract_json(response.content)
 
-            research_data = json.loads(content)
+            research_data = orjson.loads(content)
             research_data["_meta"] = {
-                "tokens_used": response["usage"],
-                "stop_reason": response["stop_reason"]
+                "tokens_used": response.usage,
+                "stop_reason": response.stop_reason
             }
             return research_data
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             # Fallback: return raw content if JSON parsing fails
             return {
                 "topic": topic,
-                "research_summary": response["content"],
+                "research_summary": response.content,
                 "error": f"JSON parsing failed: {str(e)}",
-                "_meta": response["usage"]
+                "_meta": response.usage
             }
 
     async def validate_sources(self, sources: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -126,15 +158,18 @@ For each source, assess:
 Return credibility score: high|medium|low with brief reasoning.
 """
 
-        sources_text = "\n\n".join([
-            f"Source {i+1}:\nTitle: {s.get('title', 'N/A')}\nURL: {s.get('url', 'N/A')}"
-            for i, s in enumerate(sources)
-        ])
-
-        response = await self.generate(
-            system_prompt=validation_prompt,
-            user_message=sources_text,
-            temperature=0.3
+        # Validate in small chunks so large source lists stay within context,
+        # fanning out a bounded number of rate-limited calls at once
+        chunks = [
+            sources[i:i + self.VALIDATION_CHUNK_SIZE]
+            for i in range(0, len(sources), self.VALIDATION_CHUNK_SIZE)
+        ]
+        await gather_bounded(
+            (
+                self._validate_chunk(validation_prompt, chunk, offset * self.VALIDATION_CHUNK_SIZE)
+                for offset, chunk in enumerate(chunks)
+            ),
+            limit=self.VALIDATION_CONCURRENCY
         )
 
         # For now, return sources with validation notes
@@ -144,3 +179,22 @@ Return credibility score: high|medium|low with brief reasoning.
                 source["credibility"] = "medium"  # Default
 
         return sources
+
+    async def _validate_chunk(
+        self,
+        validation_prompt: str,
+        sources: List[Dict[str, Any]],
+        start: int
+    ) -> GenerateResult:
+        """Run one validation call over a chunk of sources."""
+        sources_text = "\n\n".join(
+            f"Source {i+1}:\nTitle: {s.get('title', 'N/A')}\nURL: {s.get('url', 'N/A')}"
+            for i, s in enumerate(sources, start)
+        )
+
+        await provider_bucket.acquire()
+        return await self.generate(
+            system_prompt=validation_prompt,
+            user_message=sources_text,
+            temperature=0.3
+        )
@@ -0,0 +1,11 @@
+"""Result type shared by the provider agents."""
+from typing import Any, Dict, List, NamedTuple, Optional
+
+
+class GenerateResult(NamedTuple):
+    """Response from a single generate() call."""
+
+    content: str
+    stop_reason: Optional[str]
+    usage: Dict[str, int]
+    tool_calls: Optional[List[Dict[str, Any]]] = None
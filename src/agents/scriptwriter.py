@@ -1,12 +1,18 @@
 """Script generation agent for YouTube videos."""
-from typing import Dict, Any, Optional
-from src.agents.base import ClaudeAgent
-from src.agents.openai_base import OpenAIAgent
+from typing import AsyncIterator, Dict, Any, List, Optional, Tuple, Union
+import orjson
+from src.agents._json_utils import extract_json
+from src.agents.cache import cached, normalize_research
+from src.agents.result import GenerateResult
 from src.config import settings
 
 
-# Select the appropriate base class based on configuration
-BaseAgent = OpenAIAgent if settings.AI_PROVIDER == "openai" else ClaudeAgent
+# Select the appropriate base class based on configuration, importing only
+# the SDK of the configured provider
+if settings.AI_PROVIDER == "openai":
+    from src.agents.openai_base import OpenAIAgent as BaseAgent
+else:
+    from src.agents.base import ClaudeAgent as BaseAgent
 
 
 class ScriptwriterAgent(BaseAgent):
@@ -58,6 +64,7 @@ Best Practices:
 - End sections with smooth transitions
 """
 
+    @cached("script", normalize=normalize_research)
     async def generate_script(
         self,
         research_data: Dict[str, Any],
@@ -77,6 +84,79 @@ Best Practices:
         Returns:
             Generated script dict
         """
+        user_message = self._build_script_prompt(research_data, style, duration, brand_voice)
+
+        response = await self.generate(
+            system_prompt=self.SYSTEM_PROMPT,
+            user_message=user_message,
+            temperature=0.8  # Higher creativity for script writing
+        )
+
+        return self._parse_script(response, research_data, style, duration)
+
+    async def stream_script(
+        self,
+        research_data: Dict[str, Any],
+        style: str = "educational",
+        duration: str = "10-15 minutes",
+        brand_voice: Optional[str] = None
+    ) -> AsyncIterator[Union[str, Dict[str, Any]]]:
+        """
+        Generate YouTube script from research data, streaming tokens.
+
+        Args:
+            research_data: Research findings from ResearchAgent
+            style: Script style (educational|entertaining|inspirational)
+            duration: Target video duration
+            brand_voice: Optional brand voice guidelines
+
+        Yields:
+            Text deltas as they arrive, then the parsed script dict
+        """
+        user_message = self._build_script_prompt(research_data, style, duration, brand_voice)
+
+        async for chunk in self.generate_stream(
+            system_prompt=self.SYSTEM_PROMPT,
+            user_message=user_message,
+            temperature=0.8
+        ):
+            if isinstance(chunk, str):
+                yield chunk
+            else:
+                yield self._parse_script(chunk, research_data, style, duration)
+
+    async def generate_scripts_batch(
+        self,
+        jobs: List[Tuple[Dict[str, Any], str, str, Optional[str]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate several scripts through the provider's batch API.
+
+        Args:
+            jobs: (research_data, style, duration, brand_voice) per script
+
+        Returns:
+            Script dicts in input order; failed requests carry an "error" key
+        """
+        responses = await self.generate_batch([
+            (self.SYSTEM_PROMPT, self._build_script_prompt(*job), 0.8)
+            for job in jobs
+        ])
+
+        return [
+            {"error": str(response)} if isinstance(response, Exception)
+            else self._parse_script(response, research_data, style, duration)
+            for (research_data, style, duration, _), response in zip(jobs, responses)
+        ]
+
+    def _build_script_prompt(
+        self,
+        research_data: Dict[str, Any],
+        style: str,
+        duration: str,
+        brand_voice: Optional[str]
+    ) -> str:
+        """Build the script generation prompt from research data."""
         # Build context from research
         topic = research_data.get("topic", "Unknown topic")
         key_findings = research_data.get("key_findings", [])
@@ -86,22 +166,19 @@ Best Practices:
 
         brand_section = f"\n\nBrand Voice Guidelines:\n{brand_voice}" if brand_voice else ""
 
-        user_message = f"""Create a YouTube video script based on this research:
-
-TOPIC: {topic}
-
-RESEARCH SUMMARY:
-{research_summary}
-
-KEY FINDINGS:
-{chr(10).join(f"- {finding}" for finding in key_findings[:5])}
-
-STATISTICS TO INCLUDE:
-{chr(10).join(f"- {stat}" for stat in statistics[:5])}
-
-HOOK IDEAS:
-{chr(10).join(f"- {hook}" for hook in hook_ideas[:3])}
-
+        # Assemble the prompt in one buffer rather than nested joins
+        parts = [
+            "Create a YouTube video script based on this research:\n\n",
+            f"TOPIC: {topic}\n\n",
+            f"RESEARCH SUMMARY:\n{research_summary}\n\n",
+            "KEY FINDINGS:\n"
+        ]
+        parts.extend(f"- {finding}\n" for finding in key_findings[:5])
+        parts.append("\nSTATISTICS TO INCLUDE:\n")
+        parts.extend(f"- {stat}\n" for stat in statistics[:5])
+        parts.append("\nHOOK IDEAS:\n")
+        parts.extend(f"- {hook}\n" for hook in hook_ideas[:3])
+        parts.append(f"""
 SCRIPT REQUIREMENTS:
 - Style: {style}
 - Target Duration: {duration}
@@ -111,39 +188,36 @@ SCRIPT REQUIREMENTS:
 
 Generate the complete script in the specified JSON format.
 Ensure the hook is compelling and the content flows naturally.
-"""
-
-        response = await self.generate(
-            system_prompt=self.SYSTEM_PROMPT,
-            user_message=user_message,
-            temperature=0.8  # Higher creativity for script writing
-        )
+""")
+        return "".join(parts)
 
-        # Parse JSON response
-        import json
+    def _parse_script(
+        self,
+        response: GenerateResult,
+        research_data: Dict[str, Any],
+        style: str,
+        duration: str
+    ) -> Dict[str, Any]:
+        """Parse a script generation response into a script dict."""
         try:
-            content = response["content"]
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0].strip()
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0].strip()
+            content = extract_json(response.content)
 
-            script_data = json.loads(content)
+            script_data = orjson.loads(content)
             script_data["_meta"] = {
-                "tokens_used": response["usage"],
-                "stop_reason": response["stop_reason"],
+                "tokens_used": response.usage,
+                "stop_reason": response.stop_reason,
                 "style": style,
                 "duration": duration
             }
             return script_data
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             # Fallback
             return {
-                "title": topic,
-                "full_script": response["content"],
+                "title": research_data.get("topic", "Unknown topic"),
+                "full_script": response.content,
                 "error": f"JSON parsing failed: {str(e)}",
-                "_meta": response["usage"]
+                "_meta": response.usage
             }
 
     async def refine_script(
@@ -179,14 +253,11 @@ Return the complete refined script in JSON format.
             temperature=0.7
         )
 
-        import json
         try:
-            content = response["content"]
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0].strip()
-            return json.loads(content)
-        except json.JSONDecodeError:
+            content = extract_json(response.content)
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
             return {
-                "full_script": response["content"],
+                "full_script": response.content,
                 "error": "Refinement completed but JSON parsing failed"
             }
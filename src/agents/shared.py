@@ -0,0 +1,27 @@
+"""Process-wide agent instances shared by the services."""
+from functools import lru_cache
+
+from src.config import settings
+
+
+@lru_cache(maxsize=None)
+def get_researcher():
+    """
+    Return the research agent for the configured provider.
+
+    OpenAI uses WebResearchAgent for real web search; Anthropic keeps
+    ResearchAgent.
+    """
+    if settings.AI_PROVIDER == "openai":
+        from src.agents.web_research_agent import WebResearchAgent
+        return WebResearchAgent()
+
+    from src.agents.researcher import ResearchAgent
+    return ResearchAgent()
+
+
+@lru_cache(maxsize=None)
+def get_scriptwriter():
+    """Return the scriptwriter agent."""
+    from src.agents.scriptwriter import ScriptwriterAgent
+    return ScriptwriterAgent()
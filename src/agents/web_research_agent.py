@@ -1,7 +1,21 @@
 """Research agent using OpenAI Agents SDK with real web search."""
-import json
-from typing import Dict, Any
-from agents import Agent, WebSearchTool, Runner
+import orjson
+from types import MappingProxyType
+from typing import Dict, Any, Final, Mapping, Optional
+from agents import Agent, WebSearchTool, Runner, set_default_openai_client
+from openai import AsyncOpenAI
+from src.agents._research_utils import DEEP_RESEARCH_FOCUSES, merge_research
+from src.agents.cache import cached, normalize_topic
+from src.agents.concurrency import gather_bounded
+from src.agents.http import ASYNC_HTTPX
+from src.config import settings
+
+
+_DEPTH_INSTRUCTIONS: Final[Mapping[str, str]] = MappingProxyType({
+    "quick": "Focus on 2-3 top sources with key highlights. Be concise.",
+    "medium": "Gather 4-6 diverse sources with comprehensive analysis",
+    "deep": "Conduct extensive research with 8-10 sources, detailed fact-checking"
+})
 
 
 class WebResearchAgent:
@@ -9,6 +23,13 @@ class WebResearchAgent:
 
     def __init__(self):
         """Initialize the web research agent with search capabilities."""
+        # Runner builds its own OpenAI client by default; point it at the
+        # shared connection pool used by the other agents instead
+        set_default_openai_client(AsyncOpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            http_client=ASYNC_HTTPX
+        ))
+
         self.agent = Agent(
             name="Research Assistant",
             instructions="""You are an expert research assistant specializing in gathering and synthesizing information for YouTube video scripts.
@@ -57,10 +78,14 @@ Focus on:
             tools=[WebSearchTool()],
         )
 
+    @cached("research", normalize=normalize_topic)
     async def research_topic(self, topic: str, depth: str = "medium") -> Dict[str, Any]:
         """
         Research a topic using web search and synthesize findings.
 
+        Deep research runs one agent per focus area concurrently, at most
+        settings.RESEARCH_CONCURRENCY at a time, and merges the findings.
+
         Args:
             topic: The research topic
             depth: Research depth (quick|medium|deep)
@@ -68,18 +93,30 @@ Focus on:
         Returns:
             Research findings dict
         """
-        depth_instructions = {
-            "quick": "Focus on 2-3 top sources with key highlights. Be concise.",
-            "medium": "Gather 4-6 diverse sources with comprehensive analysis",
-            "deep": "Conduct extensive research with 8-10 sources, detailed fact-checking"
-        }
+        if depth != "deep":
+            return await self._research(topic, depth)
+
+        results = await gather_bounded(
+            (self._research(topic, depth, focus=focus) for focus in DEEP_RESEARCH_FOCUSES),
+            limit=settings.RESEARCH_CONCURRENCY
+        )
+        return merge_research(topic, results)
+
+    async def _research(
+        self,
+        topic: str,
+        depth: str,
+        focus: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Run a single web research pass and parse its JSON findings."""
+        focus_section = f"\nResearch Focus: {focus}\n" if focus else ""
 
         user_message = f"""Research the following topic for a YouTube video:
 
 Topic: {topic}
 
-Research Depth: {depth} - {depth_instructions.get(depth, depth_instructions['medium'])}
-
+Research Depth: {depth} - {_DEPTH_INSTRUCTIONS.get(depth, _DEPTH_INSTRUCTIONS['medium'])}
+{focus_section}
 Steps to follow:
 1. Use web search to find current, authoritative information about this topic
 2. Search for multiple queries to get diverse perspectives (e.g., "{topic}", "{topic} trends 2025", "{topic} statistics", "{topic} latest news")
@@ -104,7 +141,7 @@ Ensure all statistics and claims include source attribution with URLs from your
 
             if start_idx != -1 and end_idx > start_idx:
                 json_str = response_text[start_idx:end_idx]
-                research_data = json.loads(json_str)
+                research_data = orjson.loads(json_str)
             else:
                 # If no JSON found, create structured response from text
                 research_data = {
@@ -116,7 +153,7 @@ Ensure all statistics and claims include source attribution with URLs from your
                     "sources": [],
                     "research_summary": response_text[:200]
                 }
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             # Fallback: create basic structure
             research_data = {
                 "topic": topic,
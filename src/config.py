@@ -1,31 +1,47 @@
 """Application configuration."""
 import os
+from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
+from typing import Any, Tuple
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+
+def _env(name: str, default: str = "") -> Any:
+    """Field whose default is read from the environment at instantiation."""
+    return field(default_factory=lambda: os.getenv(name, default))
+
+
+@dataclass(frozen=True)
 class Settings:
     """Application settings."""
 
     # API Keys
-    ANTHROPIC_API_KEY: str = os.getenv("ANTHROPIC_API_KEY", "")
-    OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
+    ANTHROPIC_API_KEY: str = _env("ANTHROPIC_API_KEY")
+    OPENAI_API_KEY: str = _env("OPENAI_API_KEY")
 
     # AI Provider Selection
-    AI_PROVIDER: str = os.getenv("AI_PROVIDER", "openai")  # "openai" or "anthropic"
+    AI_PROVIDER: str = _env("AI_PROVIDER", "openai")  # "openai" or "anthropic"
 
     # Application
-    DEBUG: bool = os.getenv("DEBUG", "false").lower() == "true"
-    HOST: str = os.getenv("HOST", "0.0.0.0")
-    PORT: int = int(os.getenv("PORT", "8000"))
+    DEBUG: bool = field(default_factory=lambda: os.getenv("DEBUG", "false").lower() == "true")
+    HOST: str = _env("HOST", "0.0.0.0")
+    PORT: int = field(default_factory=lambda: int(os.getenv("PORT", "8000")))
+    # Comma-separated origins allowed to call the API from other sites
+    CORS_ORIGINS: Tuple[str, ...] = field(default_factory=lambda: tuple(
+        origin.strip()
+        for origin in os.getenv("CORS_ORIGINS", "http://localhost:8000,http://127.0.0.1:8000").split(",")
+        if origin.strip()
+    ))
 
     # Database
-    DATABASE_URL: str = os.getenv(
-        "DATABASE_URL",
-        "sqlite+aiosqlite:///./data/scripts.db"
-    )
+    DATABASE_URL: str = _env("DATABASE_URL", "sqlite+aiosqlite:///./data/scripts.db")
+    DB_POOL_SIZE: int = field(default_factory=lambda: int(os.getenv("DB_POOL_SIZE", "5")))
+    DB_MAX_OVERFLOW: int = field(default_factory=lambda: int(os.getenv("DB_MAX_OVERFLOW", "10")))
+    DB_POOL_RECYCLE: int = 1800  # Seconds before a pooled connection is replaced
 
     # Claude Configuration
     CLAUDE_MODEL: str = "claude-3-5-sonnet-20241022"
@@ -35,15 +51,25 @@ class Settings:
 
     # Common Configuration
     MAX_TOKENS: int = 4096
+    # Research sub-queries in flight at once for "deep" requests
+    RESEARCH_CONCURRENCY: int = field(default_factory=lambda: int(os.getenv("RESEARCH_CONCURRENCY", "5")))
 
     # Authentication
-    SECRET_KEY: str = os.getenv("SECRET_KEY", "your-secret-key-change-in-production-min-32-chars")
+    SECRET_KEY: str = _env("SECRET_KEY", "your-secret-key-change-in-production-min-32-chars")
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7  # 7 days
 
+    # Set once validate() has run
+    _validated: bool = field(default=False, init=False, repr=False, compare=False)
+
     # Project paths
-    BASE_DIR: Path = Path(__file__).resolve().parent.parent
-    DATA_DIR: Path = BASE_DIR / "data"
+    @cached_property
+    def BASE_DIR(self) -> Path:
+        return Path(__file__).resolve().parent.parent
+
+    @cached_property
+    def DATA_DIR(self) -> Path:
+        return self.BASE_DIR / "data"
 
     def validate(self) -> None:
         """Validate required settings."""
@@ -57,6 +83,8 @@ class Settings:
             raise ValueError("AI_PROVIDER must be 'openai' or 'anthropic'")
 
         # Ensure data directory exists
-        self.DATA_DIR.mkdir(exist_ok=True)
+        if not self._validated:
+            self.DATA_DIR.mkdir(exist_ok=True)
+            object.__setattr__(self, "_validated", True)
 
 settings = Settings()
@@ -1,15 +1,20 @@
 """FastAPI application entry point."""
-from datetime import datetime
+import asyncio
+import logging
+import time
 from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import Optional
 from fastapi import FastAPI, HTTPException, Depends
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
+from sqlalchemy import delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.config import settings
-from src.models import init_db, get_db
+from src.agents.http import ASYNC_HTTPX
+from src.models import init_db, get_db, AsyncSessionLocal
 from src.models.schemas import (
+    BulkGenerateRequest,
     GenerateScriptRequest,
     ScriptResponse,
     ScriptListResponse,
@@ -19,45 +24,68 @@ from src.models.schemas import (
 )
 from src.models.auth_schemas import UserCreate, UserLogin, UserResponse, Token
 from src.services import ScriptService
+from src.services.script_service import BATCH_THRESHOLD
 from src.services.analytics_service import AnalyticsService
 from src.services.template_service import TemplateService
 from src.services.auth_service import auth_service
 from src.services.refinement_service import refinement_service
 from src.services.export_service import export_service
 from src.utils.auth_dependencies import get_current_user, get_current_user_optional
-from src.models.database import User
+from src.utils.cors import APICORSMiddleware
+from src.utils.log import start_logging, stop_logging
+from src.models.database import Script, User, engine
 from fastapi.responses import StreamingResponse
 import io
 
+TEMPLATES_DIR = Path(__file__).parent / "templates"
+
+# Let browsers reuse the static pages briefly between visits
+HTML_CACHE_HEADERS = {"Cache-Control": "public, max-age=300"}
+
+# Pre-serialized health payload; only the Unix timestamp is filled per probe
+_HEALTH_TEMPLATE = b'{"status":"healthy","version":"1.0.0","timestamp":"%.3f"}'
+
+logger = logging.getLogger(__name__)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events."""
     # Startup
-    print("Initializing database...")
+    start_logging()
+    logger.info("Initializing database...")
     await init_db()
-    print("Validating configuration...")
+    logger.info("Validating configuration...")
     settings.validate()
-    print("Application started successfully!")
+    # Read the static pages once instead of on every request
+    app.state.index_html = (TEMPLATES_DIR / "index.html").read_bytes()
+    app.state.dashboard_html = (TEMPLATES_DIR / "dashboard.html").read_bytes()
+    logger.info("Application started successfully!")
     yield
     # Shutdown
-    print("Application shutting down...")
+    logger.info("Application shutting down...")
+    # Stop background batch jobs before the clients they use are closed
+    await script_service.stop_batch_jobs()
+    await ASYNC_HTTPX.aclose()
+    await engine.dispose()
+    stop_logging()
 
 
 app = FastAPI(
     title="AI Research-to-Video Script Agent",
     description="Automated research and YouTube script generation using Claude AI",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
-# CORS middleware
+# CORS middleware, applied to /api routes only
 app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # In production, specify allowed origins
+    APICORSMiddleware,
+    allow_origins=list(settings.CORS_ORIGINS),
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "DELETE"],
+    allow_headers=["Authorization", "Content-Type"],
 )
 
 # Service instances
@@ -69,30 +97,22 @@ template_service = TemplateService()
 @app.get("/", response_class=HTMLResponse)
 async def root():
     """Serve the frontend interface."""
-    html_path = Path(__file__).parent / "templates" / "index.html"
-    with open(html_path, "r") as f:
-        return f.read()
+    return HTMLResponse(app.state.index_html, headers=HTML_CACHE_HEADERS)
 
 
 @app.get("/dashboard", response_class=HTMLResponse)
 async def dashboard():
     """Serve the analytics dashboard."""
-    html_path = Path(__file__).parent / "templates" / "dashboard.html"
-    with open(html_path, "r") as f:
-        return f.read()
+    return HTMLResponse(app.state.dashboard_html, headers=HTML_CACHE_HEADERS)
 
 
-@app.get("/health", response_model=HealthResponse)
+@app.get("/health", responses={200: {"model": HealthResponse}})
 async def health_check():
     """Health check endpoint."""
-    return {
-        "status": "healthy",
-        "version": "1.0.0",
-        "timestamp": datetime.utcnow().isoformat()
-    }
+    return Response(_HEALTH_TEMPLATE % time.time(), media_type="application/json")
 
 
-@app.post("/api/generate", response_model=ScriptResponse)
+@app.post("/api/generate", responses={200: {"model": ScriptResponse}})
 async def generate_script(
     request: GenerateScriptRequest,
     db: AsyncSession = Depends(get_db)
@@ -116,12 +136,71 @@ async def generate_script(
             research_depth=request.research_depth,
             brand_voice=request.brand_voice
         )
-        return result
+        # The result is built from our own saved record, so skip output
+        # validation; the request body is still validated by
+        # GenerateScriptRequest
+        return ScriptResponse.model_construct(**result)
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/api/generate/bulk")
+async def generate_scripts_bulk(
+    request: BulkGenerateRequest,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Generate several scripts concurrently and save them in one batch.
+
+    Requests with more than BATCH_THRESHOLD scripts are written through
+    the provider's discounted batch API in the background; poll
+    /api/generate/bulk/{job_id} for the outcome.
+
+    Args:
+        request: Bulk generation request
+        db: Database session
+
+    Returns:
+        Saved script summaries and per-topic errors, or the batch job status
+    """
+    if len(request.scripts) > BATCH_THRESHOLD:
+        return ORJSONResponse(
+            await script_service.start_batch_job(
+                db=db,
+                specs=[spec.model_dump() for spec in request.scripts]
+            ),
+            status_code=202
+        )
+
+    try:
+        return await script_service.generate_scripts_bulk(
+            db=db,
+            specs=[spec.model_dump() for spec in request.scripts]
+        )
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.get("/api/generate/bulk/{job_id}")
+async def get_bulk_job(job_id: str, db: AsyncSession = Depends(get_db)):
+    """
+    Get the status of a background bulk generation job.
+
+    Args:
+        job_id: Job identifier returned by /api/generate/bulk
+        db: Database session
+
+    Returns:
+        Job status, with script summaries and errors once completed
+    """
+    job = await script_service.get_batch_job(db, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
 @app.post("/api/generate/stream")
 async def generate_script_stream(
     request: GenerateScriptRequest,
@@ -171,7 +250,7 @@ async def get_script(
     """
     try:
         result = await script_service.get_script(db=db, script_id=script_id)
-        return result
+        return ORJSONResponse(result)
 
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -179,10 +258,11 @@ async def get_script(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/api/scripts", response_model=ScriptListResponse)
+@app.get("/api/scripts", responses={200: {"model": ScriptListResponse}})
 async def list_scripts(
     skip: int = 0,
     limit: int = 10,
+    before: Optional[int] = None,
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -191,21 +271,25 @@ async def list_scripts(
     Args:
         skip: Number of records to skip
         limit: Maximum number of records to return
+        before: Cursor, the id of the last script already received
         db: Database session
 
     Returns:
         List of scripts
     """
     try:
-        result = await script_service.list_scripts(db=db, skip=skip, limit=limit)
-        return result
+        result = await script_service.list_scripts(
+            db=db, skip=skip, limit=limit, before=before
+        )
+        # Serialize rows straight to JSON; orjson handles the datetimes
+        return ORJSONResponse(result)
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/api/analytics/dashboard")
-async def get_dashboard_analytics(db: AsyncSession = Depends(get_db)):
+async def get_dashboard_analytics():
     """
     Get dashboard analytics and stats.
 
@@ -213,13 +297,18 @@ async def get_dashboard_analytics(db: AsyncSession = Depends(get_db)):
         Dashboard metrics and recent scripts
     """
     try:
-        stats = await analytics_service.get_dashboard_stats(db=db)
-        recent = await analytics_service.get_recent_scripts(db=db, limit=5)
+        # Run both queries concurrently; a session can't be shared across
+        # concurrent statements, so each gets its own
+        async with AsyncSessionLocal() as stats_db, AsyncSessionLocal() as recent_db:
+            stats, recent = await asyncio.gather(
+                analytics_service.get_dashboard_stats(db=stats_db),
+                analytics_service.get_recent_scripts(db=recent_db, limit=5)
+            )
 
-        return {
+        return ORJSONResponse({
             "stats": stats,
             "recent_scripts": recent
-        }
+        })
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -233,7 +322,7 @@ async def get_templates():
     Returns:
         List of available templates
     """
-    return {"templates": template_service.get_all_templates()}
+    return Response(template_service.get_all_templates_json(), media_type="application/json")
 
 
 @app.get("/api/templates/{template_id}")
@@ -248,13 +337,10 @@ async def get_template(template_id: str):
         Template settings
     """
     try:
-        template = template_service.get_template(template_id)
-        settings = template_service.apply_template(template_id)
-
-        return {
-            "template": template,
-            "settings": settings
-        }
+        return Response(
+            template_service.get_template_json(template_id),
+            media_type="application/json"
+        )
 
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -278,15 +364,20 @@ async def delete_script(
         Success message
     """
     try:
-        from sqlalchemy import delete
-        from src.models.database import Script
-
-        result = await db.execute(
-            delete(Script).where(Script.script_id == script_id)
-        )
+        stmt = delete(Script).where(Script.script_id == script_id)
+
+        # Confirm the row existed from the DELETE itself where supported,
+        # otherwise fall back to the driver's rowcount
+        if engine.dialect.delete_returning:
+            result = await db.execute(stmt.returning(Script.script_id))
+            deleted = result.first() is not None
+        else:
+            result = await db.execute(stmt)
+            deleted = result.rowcount > 0
         await db.commit()
+        script_service.forget_script(script_id)
 
-        if result.rowcount == 0:
+        if not deleted:
             raise HTTPException(status_code=404, detail="Script not found")
 
         return {"message": "Script deleted successfully"}
@@ -410,7 +501,7 @@ async def refine_script_section(
     """
     try:
         # Get script
-        script_data = await script_service.get_script(db, script_id)
+        script_data = await script_service.get_script(db, script_id, verify=True)
 
         # Refine section
         result = await refinement_service.refine_section(
@@ -451,7 +542,7 @@ async def regenerate_script(
     """
     try:
         # Get script
-        script_data = await script_service.get_script(db, script_id)
+        script_data = await script_service.get_script(db, script_id, verify=True)
 
         # Regenerate with feedback
         result = await refinement_service.regenerate_full_script(
@@ -487,8 +578,8 @@ async def export_script_txt(
         TXT file download
     """
     try:
-        script_data = await script_service.get_script(db, script_id)
-        content = export_service.export_to_txt(script_data)
+        script_data = await script_service.get_script(db, script_id, verify=True)
+        content = await export_service.export(script_data, "txt")
 
         return StreamingResponse(
             io.BytesIO(content),
@@ -520,8 +611,8 @@ async def export_script_docx(
         DOCX file download
     """
     try:
-        script_data = await script_service.get_script(db, script_id)
-        content = export_service.export_to_docx(script_data)
+        script_data = await script_service.get_script(db, script_id, verify=True)
+        content = await export_service.export(script_data, "docx")
 
         return StreamingResponse(
             io.BytesIO(content),
@@ -553,8 +644,8 @@ async def export_script_pdf(
         PDF file download
     """
     try:
-        script_data = await script_service.get_script(db, script_id)
-        content = export_service.export_to_pdf(script_data)
+        script_data = await script_service.get_script(db, script_id, verify=True)
+        content = await export_service.export(script_data, "pdf")
 
         return StreamingResponse(
             io.BytesIO(content),
@@ -571,10 +662,13 @@ async def export_script_pdf(
 
 
 if __name__ == "__main__":
+    import sys
     import uvicorn
     uvicorn.run(
         "src.main:app",
         host=settings.HOST,
         port=settings.PORT,
-        reload=settings.DEBUG
+        reload=settings.DEBUG,
+        # uvloop has no Windows build
+        loop="asyncio" if sys.platform == "win32" else "uvloop"
     )
@@ -1,4 +1,4 @@
 """Database models."""
-from src.models.database import Base, Script, init_db, get_db, AsyncSessionLocal
+from src.models.database import Base, BatchJob, Script, init_db, get_db, AsyncSessionLocal
 
-__all__ = ["Base", "Script", "init_db", "get_db", "AsyncSessionLocal"]
+__all__ = ["Base", "BatchJob", "Script", "init_db", "get_db", "AsyncSessionLocal"]
@@ -1,14 +1,72 @@
 """Database models and setup."""
+import zlib
 from datetime import datetime
-from typing import Optional
-from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, Float, Boolean, ForeignKey
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from typing import Any, Optional
+import orjson
+from sqlalchemy import (
+    Column, Integer, String, Text, DateTime, JSON, Float, Boolean, ForeignKey,
+    LargeBinary, TypeDecorator
+)
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import declarative_base, relationship
+from sqlalchemy.sql.expression import FunctionElement
 
 from src.config import settings
 
 Base = declarative_base()
 
+# zlib level for stored JSON blobs; 6 is the usual size/speed balance
+JSON_COMPRESSION_LEVEL = 6
+
+
+class utcnow(FunctionElement):
+    """Current UTC time as generated by the database, for server defaults."""
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _utcnow_default(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow, "postgresql")
+def _utcnow_postgresql(element, compiler, **kw):
+    # now() is in the session time zone; the columns are naive UTC
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+@compiles(utcnow, "sqlite")
+def _utcnow_sqlite(element, compiler, **kw):
+    # CURRENT_TIMESTAMP is UTC here but only has 1-second resolution
+    return "STRFTIME('%Y-%m-%d %H:%M:%f', 'now')"
+
+
+class CompressedJSON(TypeDecorator):
+    """
+    JSON value stored as zlib-compressed bytes.
+
+    Rows written before compression was introduced hold plain JSON text;
+    those are still read as-is.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value: Any, dialect) -> Optional[bytes]:
+        if value is None:
+            return None
+        return zlib.compress(orjson.dumps(value), JSON_COMPRESSION_LEVEL)
+
+    def process_result_value(self, value: Any, dialect) -> Any:
+        if value is None:
+            return None
+        if isinstance(value, str):
+            return orjson.loads(value)
+        return orjson.loads(zlib.decompress(value))
+
 
 class User(Base):
     """User model for authentication."""
@@ -55,16 +113,16 @@ class Script(Base):
     style = Column(String(50), default="educational")
     duration = Column(String(50), default="10-15 minutes")
 
-    # Research Data
-    research_data = Column(JSON, nullable=True)
-    sources = Column(JSON, nullable=True)
+    # Research Data, compressed as it is the bulk of each row
+    research_data = Column(CompressedJSON, nullable=True)
+    sources = Column(CompressedJSON, nullable=True)
 
     # Script Content
     title = Column(String(200), nullable=True)
     description = Column(Text, nullable=True)
     keywords = Column(JSON, nullable=True)
     full_script = Column(Text, nullable=False)
-    script_sections = Column(JSON, nullable=True)
+    script_sections = Column(CompressedJSON, nullable=True)
 
     # Metadata
     estimated_duration = Column(String(50), nullable=True)
@@ -76,12 +134,15 @@ class Script(Base):
     generation_time = Column(Float, nullable=True)  # in seconds
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False, index=True)
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=utcnow())
 
     # Relationships
     user = relationship("User", back_populates="scripts")
 
+    # Load the database-generated timestamps as part of each flush
+    __mapper_args__ = {"eager_defaults": True}
+
     def to_dict(self):
         """Convert model to dictionary."""
         return {
@@ -102,16 +163,63 @@ class Script(Base):
             "sources": self.sources,
             "tokens_used": self.tokens_used,
             "generation_time": self.generation_time,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            # Datetimes are left for the orjson response layer to encode
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
         }
 
 
+class BatchJob(Base):
+    """Background bulk generation job, stored so every worker can report on it."""
+
+    __tablename__ = "batch_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    job_id = Column(String(36), unique=True, index=True, nullable=False)
+    status = Column(String(20), default="pending", nullable=False)
+    total = Column(Integer, nullable=False)
+
+    # Outcome: saved script summaries and per-spec errors, or why the job failed
+    result = Column(JSON, nullable=True)
+    error = Column(Text, nullable=True)
+
+    # Timestamps
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def to_dict(self):
+        """Convert model to the job status response."""
+        job = {"job_id": self.job_id, "status": self.status, "total": self.total}
+        if self.result:
+            job.update(self.result)
+        if self.error:
+            job["error"] = self.error
+        return job
+
+
 # Database engine and session
+_pool_options = {
+    "pool_pre_ping": True,
+    "pool_recycle": settings.DB_POOL_RECYCLE
+}
+# In-memory SQLite uses a single static connection with no size limits
+if ":memory:" not in settings.DATABASE_URL:
+    _pool_options["pool_size"] = settings.DB_POOL_SIZE
+    _pool_options["max_overflow"] = settings.DB_MAX_OVERFLOW
+
+
+def _json_dumps(value: Any) -> str:
+    """Serialize plain JSON columns with orjson instead of the stdlib encoder."""
+    return orjson.dumps(value).decode()
+
+
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,
-    future=True
+    future=True,
+    json_serializer=_json_dumps,
+    json_deserializer=orjson.loads,
+    **_pool_options
 )
 
 AsyncSessionLocal = async_sessionmaker(
@@ -121,9 +229,14 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 
-async def init_db():
-    """Initialize database tables."""
-    async with engine.begin() as conn:
+async def init_db(bind: Optional[AsyncEngine] = None):
+    """
+    Initialize database tables.
+
+    Args:
+        bind: Engine to create the tables on, the application engine by default
+    """
+    async with (bind or engine).begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
 
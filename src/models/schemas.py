@@ -13,6 +13,12 @@ class GenerateScriptRequest(BaseModel):
     brand_voice: Optional[str] = Field(None, description="Optional brand voice guidelines")
 
 
+class BulkGenerateRequest(BaseModel):
+    """Request schema for generating several scripts in one call."""
+
+    scripts: List[GenerateScriptRequest] = Field(..., min_length=1, max_length=200, description="Scripts to generate")
+
+
 class Source(BaseModel):
     """Source information schema."""
 
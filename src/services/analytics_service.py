@@ -1,6 +1,6 @@
 """Analytics service for dashboard metrics."""
 from typing import Dict, Any
-from sqlalchemy import select, func
+from sqlalchemy import case, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timedelta
 
@@ -17,42 +17,37 @@ class AnalyticsService:
         Returns:
             Dashboard metrics including counts, averages, and trends
         """
-        # Total scripts count
-        total_result = await db.execute(select(func.count(Script.id)))
-        total_scripts = total_result.scalar() or 0
-
-        # Scripts this week
         week_ago = datetime.utcnow() - timedelta(days=7)
-        week_result = await db.execute(
-            select(func.count(Script.id)).where(Script.created_at >= week_ago)
-        )
-        scripts_this_week = week_result.scalar() or 0
 
-        # Average generation time
-        avg_time_result = await db.execute(
-            select(func.avg(Script.generation_time)).where(
-                Script.generation_time.isnot(None)
-            )
+        # Most used style, folded into the aggregate query as a subquery
+        top_style = (
+            select(Script.style)
+            .group_by(Script.style)
+            .order_by(func.count(Script.id).desc())
+            .limit(1)
+            .scalar_subquery()
         )
-        avg_generation_time = avg_time_result.scalar() or 0
 
-        # Total tokens used
-        tokens_result = await db.execute(
-            select(func.sum(Script.tokens_used)).where(
-                Script.tokens_used.isnot(None)
+        # All stats in one round-trip; AVG and SUM already skip NULLs
+        result = await db.execute(
+            select(
+                func.count(Script.id),
+                func.count(case((Script.created_at >= week_ago, Script.id))),
+                func.avg(Script.generation_time),
+                func.sum(Script.tokens_used),
+                top_style
             )
         )
-        total_tokens = tokens_result.scalar() or 0
+        (
+            total_scripts,
+            scripts_this_week,
+            avg_generation_time,
+            total_tokens,
+            most_used_style
+        ) = result.one()
 
-        # Most used style
-        style_result = await db.execute(
-            select(Script.style, func.count(Script.id).label('count'))
-            .group_by(Script.style)
-            .order_by(func.count(Script.id).desc())
-            .limit(1)
-        )
-        style_row = style_result.first()
-        most_used_style = style_row[0] if style_row else "educational"
+        total_tokens = total_tokens or 0
+        most_used_style = most_used_style or "educational"
 
         return {
             "total_scripts": total_scripts,
@@ -69,12 +64,21 @@ class AnalyticsService:
         limit: int = 5
     ) -> list:
         """Get recent scripts for dashboard."""
+        # Select only the summary columns, leaving the large script text
+        # and JSON blobs in the database
         result = await db.execute(
-            select(Script)
-            .order_by(Script.created_at.desc())
+            select(
+                Script.script_id,
+                Script.topic,
+                Script.title,
+                Script.style,
+                Script.created_at,
+                Script.tokens_used,
+                Script.generation_time
+            )
+            .order_by(Script.created_at.desc(), Script.id.desc())
             .limit(limit)
         )
-        scripts = result.scalars().all()
 
         return [
             {
@@ -82,9 +86,9 @@ class AnalyticsService:
                 "topic": s.topic,
                 "title": s.title,
                 "style": s.style,
-                "created_at": s.created_at.isoformat() if s.created_at else None,
+                "created_at": s.created_at,
                 "tokens_used": s.tokens_used or 0,
                 "generation_time": round(s.generation_time, 1) if s.generation_time else 0
             }
-            for s in scripts
+            for s in result.all()
         ]
@@ -1,6 +1,7 @@
 """Export service for scripts."""
 import io
 from typing import Dict, Any
+import anyio.to_thread
 from docx import Document
 from docx.shared import Pt, RGBColor
 from reportlab.lib.pagesizes import letter
@@ -8,10 +9,66 @@ from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
 
+from src.agents.cache import TTLCache
+
+# Rendered exports kept for repeat downloads; keys include updated_at so
+# edited scripts are re-rendered
+EXPORT_CACHE_SIZE = 64
+EXPORT_CACHE_TTL = 60 * 60
+
+# PDF paragraph styles, built once and shared by every export
+_PDF_STYLES = getSampleStyleSheet()
+_PDF_STYLES.add(ParagraphStyle(name='CustomTitle',
+                               parent=_PDF_STYLES['Heading1'],
+                               fontSize=24,
+                               textColor=RGBColor(0x26, 0x32, 0x44),
+                               spaceAfter=30,
+                               alignment=1))
+
+_PDF_STYLES.add(ParagraphStyle(name='MetaLabel',
+                               parent=_PDF_STYLES['Normal'],
+                               fontSize=10,
+                               textColor=RGBColor(0x64, 0x74, 0x8b),
+                               spaceAfter=6))
+
+_PDF_STYLES.add(ParagraphStyle(name='MetaValue',
+                               parent=_PDF_STYLES['Normal'],
+                               fontSize=12,
+                               spaceAfter=12))
+
 
 class ExportService:
     """Service for exporting scripts to various formats."""
 
+    FORMATS = ("txt", "docx", "pdf")
+
+    def __init__(self):
+        """Initialize the rendered export cache."""
+        self._cache = TTLCache(maxsize=EXPORT_CACHE_SIZE, ttl=EXPORT_CACHE_TTL)
+
+    async def export(self, script_data: Dict[str, Any], fmt: str) -> bytes:
+        """
+        Render a script export off the event loop, reusing cached output.
+
+        Args:
+            script_data: Script data dictionary
+            fmt: Export format (txt|docx|pdf)
+
+        Returns:
+            File content as bytes
+        """
+        if fmt not in self.FORMATS:
+            raise ValueError(f"Unsupported export format: {fmt}")
+
+        key = (script_data.get("script_id"), fmt, script_data.get("updated_at"))
+        content = self._cache.get(key)
+        if content is None:
+            # docx/reportlab rendering is CPU-bound; keep it off the loop
+            exporter = getattr(self, f"export_to_{fmt}")
+            content = await anyio.to_thread.run_sync(exporter, script_data)
+            self._cache.set(key, content)
+        return content
+
     @staticmethod
     def export_to_txt(script_data: Dict[str, Any]) -> bytes:
         """
@@ -72,6 +129,8 @@ class ExportService:
             DOCX content as bytes
         """
         doc = Document()
+        # Body paragraphs use the Normal style; size it once for the document
+        doc.styles['Normal'].font.size = Pt(12)
 
         # Title
         title = doc.add_heading(script_data.get("title", "YouTube Script"), 0)
@@ -109,8 +168,7 @@ class ExportService:
         # Split into paragraphs for better formatting
         for paragraph in script_text.split("\n\n"):
             if paragraph.strip():
-                p = doc.add_paragraph(paragraph.strip())
-                p.style.font.size = Pt(12)
+                doc.add_paragraph(paragraph.strip())
 
         # Save to bytes
         file_stream = io.BytesIO()
@@ -138,28 +196,8 @@ class ExportService:
         # Container for 'Flowable' objects
         elements = []
 
-        # Define styles
-        styles = getSampleStyleSheet()
-        styles.add(ParagraphStyle(name='CustomTitle',
-                                  parent=styles['Heading1'],
-                                  fontSize=24,
-                                  textColor=RGBColor(0x26, 0x32, 0x44),
-                                  spaceAfter=30,
-                                  alignment=1))
-
-        styles.add(ParagraphStyle(name='MetaLabel',
-                                  parent=styles['Normal'],
-                                  fontSize=10,
-                                  textColor=RGBColor(0x64, 0x74, 0x8b),
-                                  spaceAfter=6))
-
-        styles.add(ParagraphStyle(name='MetaValue',
-                                  parent=styles['Normal'],
-                                  fontSize=12,
-                                  spaceAfter=12))
-
         # Title
-        title = Paragraph(script_data.get("title", "YouTube Script"), styles['CustomTitle'])
+        title = Paragraph(script_data.get("title", "YouTube Script"), _PDF_STYLES['CustomTitle'])
         elements.append(title)
         elements.append(Spacer(1, 12))
 
@@ -171,33 +209,33 @@ class ExportService:
         ]
 
         for label, value in metadata_items:
-            elements.append(Paragraph(f"<b>{label}</b>", styles['MetaLabel']))
-            elements.append(Paragraph(value, styles['MetaValue']))
+            elements.append(Paragraph(f"<b>{label}</b>", _PDF_STYLES['MetaLabel']))
+            elements.append(Paragraph(value, _PDF_STYLES['MetaValue']))
 
         elements.append(Spacer(1, 20))
 
         # Description
         if script_data.get("description"):
-            elements.append(Paragraph("<b>Description</b>", styles['Heading2']))
+            elements.append(Paragraph("<b>Description</b>", _PDF_STYLES['Heading2']))
             elements.append(Spacer(1, 6))
-            elements.append(Paragraph(script_data.get("description"), styles['Normal']))
+            elements.append(Paragraph(script_data.get("description"), _PDF_STYLES['Normal']))
             elements.append(Spacer(1, 12))
 
         # Keywords
         if script_data.get("keywords"):
-            elements.append(Paragraph("<b>Keywords</b>", styles['Heading2']))
+            elements.append(Paragraph("<b>Keywords</b>", _PDF_STYLES['Heading2']))
             elements.append(Spacer(1, 6))
-            elements.append(Paragraph(", ".join(script_data.get("keywords", [])), styles['Normal']))
+            elements.append(Paragraph(", ".join(script_data.get("keywords", [])), _PDF_STYLES['Normal']))
             elements.append(Spacer(1, 12))
 
         # Script
-        elements.append(Paragraph("<b>Script</b>", styles['Heading2']))
+        elements.append(Paragraph("<b>Script</b>", _PDF_STYLES['Heading2']))
         elements.append(Spacer(1, 12))
 
         script_text = script_data.get("full_script", "")
         for paragraph in script_text.split("\n\n"):
             if paragraph.strip():
-                elements.append(Paragraph(paragraph.strip(), styles['Normal']))
+                elements.append(Paragraph(paragraph.strip(), _PDF_STYLES['Normal']))
                 elements.append(Spacer(1, 12))
 
         # Build PDF
@@ -1,14 +1,54 @@
 """Script refinement service."""
-from typing import Dict, Any
-from src.agents import ScriptwriterAgent
+from functools import lru_cache
+from typing import Dict, Any, Tuple
+from src.agents.shared import get_scriptwriter
+
+# Section refinement prompt; the optional blocks below are spliced in when set
+_REFINE_PROMPT = """Refine the '{section_name}' section of a YouTube video script.
+
+**Topic**: {topic}
+**Style**: {style}
+**Duration**: {duration}
+
+**Research Context**:
+{key_findings}
+
+**Current {section_title} Content**:
+{current_content}
+
+{feedback_block}{brand_block}**Task**: Improve the {section_name} section based on:
+1. User feedback (if provided)
+2. Better alignment with research findings
+3. More engaging storytelling
+4. Stronger audience connection
+5. Professional YouTube scriptwriting standards
+
+Provide ONLY the refined {section_name} content, no explanations or meta-commentary.
+"""
+
+_FEEDBACK_BLOCK = """**User Feedback**:
+{user_feedback}
+
+"""
+
+_BRAND_BLOCK = """**Brand Voice Guidelines**:
+{brand_voice}
+
+"""
+
+
+@lru_cache(maxsize=128)
+def _format_findings(findings: Tuple[str, ...]) -> str:
+    """Format key findings as a bullet list, reused across refinements."""
+    return "- " + "\n- ".join(findings) if findings else ""
 
 
 class RefinementService:
     """Service for script refinement and regeneration."""
 
     def __init__(self):
-        """Initialize service with scriptwriter agent."""
-        self.scriptwriter = ScriptwriterAgent()
+        """Initialize service with the shared scriptwriter agent."""
+        self.scriptwriter = get_scriptwriter()
 
     async def refine_section(
         self,
@@ -81,12 +121,13 @@ class RefinementService:
         else:
             enhanced_voice = brand_voice
 
-        # Generate new script
+        # Generate new script, bypassing any cached result for the same inputs
         script_data = await self.scriptwriter.generate_script(
             research_data=research_data,
             style=style,
             duration=duration,
-            brand_voice=enhanced_voice
+            brand_voice=enhanced_voice,
+            fresh=True
         )
 
         return script_data
@@ -102,46 +143,19 @@ class RefinementService:
         user_feedback: str = None
     ) -> str:
         """Build refinement prompt for section."""
-        topic = research_data.get("topic", "Unknown")
-        key_findings = "\n".join([f"- {f}" for f in research_data.get("key_findings", [])])
-
-        prompt = f"""Refine the '{section_name}' section of a YouTube video script.
-
-**Topic**: {topic}
-**Style**: {style}
-**Duration**: {duration}
-
-**Research Context**:
-{key_findings}
-
-**Current {section_name.title()} Content**:
-{current_content}
-
-"""
-
-        if user_feedback:
-            prompt += f"""**User Feedback**:
-{user_feedback}
-
-"""
-
-        if brand_voice:
-            prompt += f"""**Brand Voice Guidelines**:
-{brand_voice}
+        findings = tuple(str(f) for f in research_data.get("key_findings", []))
 
-"""
-
-        prompt += f"""**Task**: Improve the {section_name} section based on:
-1. User feedback (if provided)
-2. Better alignment with research findings
-3. More engaging storytelling
-4. Stronger audience connection
-5. Professional YouTube scriptwriting standards
-
-Provide ONLY the refined {section_name} content, no explanations or meta-commentary.
-"""
-
-        return prompt
+        return _REFINE_PROMPT.format(
+            section_name=section_name,
+            section_title=section_name.title(),
+            topic=research_data.get("topic", "Unknown"),
+            style=style,
+            duration=duration,
+            key_findings=_format_findings(findings),
+            current_content=current_content,
+            feedback_block=_FEEDBACK_BLOCK.format(user_feedback=user_feedback) if user_feedback else "",
+            brand_block=_BRAND_BLOCK.format(brand_voice=brand_voice) if brand_voice else ""
+        )
 
 
 refinement_service = RefinementService()
@@ -1,16 +1,18 @@
 """Business logic for script generation."""
+import copy
 import time
 import uuid
-import json
 import asyncio
-from typing import Dict, Any, AsyncGenerator
+import logging
+from typing import Dict, Any, AsyncGenerator, List, Optional, Set, Union
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import and_, func, or_, select, update
 
-from src.agents import ResearchAgent, ScriptwriterAgent
-from src.agents.web_research_agent import WebResearchAgent
-from src.models.database import Script
-from src.config import settings
+from src.agents.cache import TTLCache
+from src.agents.concurrency import gather_bounded
+from src.agents.shared import get_researcher, get_scriptwriter
+from src.models.database import AsyncSessionLocal, BatchJob, Script
 from src.utils import (
     validate_topic,
     validate_style,
@@ -21,20 +23,86 @@ from src.utils import (
     ResearchError
 )
 
+logger = logging.getLogger(__name__)
+
+# Process-local read cache for saved scripts. Deletes only evict in the
+# worker that handled them, so entries live just long enough to absorb
+# bursts of reads (page load, then exports) without serving stale rows long
+SCRIPT_CACHE_SIZE = 1024
+SCRIPT_CACHE_TTL = 5
+
+# Events buffered for a streaming client before progress updates are dropped
+SSE_QUEUE_SIZE = 32
+
+# Bulk generation: scripts researched/written at once, and the batch size
+# from which PostgreSQL COPY is used instead of a multi-row INSERT
+BULK_CONCURRENCY = 4
+COPY_THRESHOLD = 100
+
+# Bulk requests with more scripts than this are written through the
+# provider's batch API in the background
+BATCH_THRESHOLD = 10
+
+# Columns written by COPY
+_COPY_COLUMNS = (
+    "script_id", "topic", "style", "duration", "research_data", "sources",
+    "title", "description", "keywords", "full_script", "script_sections",
+    "estimated_duration", "tone", "target_audience", "tokens_used",
+    "generation_time"
+)
+
+# Columns returned by list_scripts, mirroring Script.to_dict()
+_LIST_COLUMNS = (
+    Script.id,
+    Script.script_id,
+    Script.topic,
+    Script.style,
+    Script.duration,
+    Script.title,
+    Script.description,
+    Script.keywords,
+    Script.full_script,
+    Script.script_sections,
+    Script.estimated_duration,
+    Script.tone,
+    Script.target_audience,
+    Script.research_data,
+    Script.sources,
+    Script.tokens_used,
+    Script.generation_time,
+    Script.created_at,
+    Script.updated_at
+)
+
+# Optional scriptwriter fields copied as-is into generation responses
+_SCRIPT_KEYS = ("title", "description", "estimated_duration", "tone", "target_audience")
+
+
+def _format_sse(data: Dict[str, Any]) -> bytes:
+    """Format data as Server-Sent Event."""
+    return b"data: " + orjson.dumps(data) + b"\n\n"
+
+
+def _tokens(agent_output: Dict[str, Any]) -> int:
+    """Total tokens recorded in an agent result's _meta, 0 if absent."""
+    usage = agent_output.get("_meta", {}).get("tokens_used", {})
+    return usage.get("input_tokens", 0) + usage.get("output_tokens", 0)
+
 
 class ScriptService:
     """Service for script generation workflow."""
 
     def __init__(self):
         """Initialize service with agents."""
-        # Use WebResearchAgent for OpenAI with real web search
-        # Keep ResearchAgent as fallback for Anthropic
-        if settings.AI_PROVIDER == "openai":
-            self.researcher = WebResearchAgent()
-        else:
-            self.researcher = ResearchAgent()
+        # Agents are shared process-wide so their clients are built once
+        self.researcher = get_researcher()
+        self.scriptwriter = get_scriptwriter()
+
+        # Saved scripts never change, so reads are cached briefly
+        self._script_cache = TTLCache(maxsize=SCRIPT_CACHE_SIZE, ttl=SCRIPT_CACHE_TTL)
 
-        self.scriptwriter = ScriptwriterAgent()
+        # Running batch job tasks, kept so they aren't collected mid-run
+        self._batch_tasks: Set[asyncio.Task] = set()
 
     async def generate_script(
         self,
@@ -59,6 +127,101 @@ class ScriptService:
         Returns:
             Complete script data dict
         """
+        result = None
+        async for event in self._run_pipeline(
+            db, topic, style, duration, research_depth, brand_voice
+        ):
+            if event["type"] == "complete":
+                result = event["data"]
+        return result
+
+    async def generate_script_stream(
+        self,
+        db: AsyncSession,
+        topic: str,
+        style: str = "educational",
+        duration: str = "10-15 minutes",
+        research_depth: str = "medium",
+        brand_voice: str = None
+    ) -> AsyncGenerator[bytes, None]:
+        """
+        Stream script generation with real-time progress updates.
+
+        The pipeline runs in a background task feeding a bounded queue, so
+        a slow client never holds up the provider calls. When the queue is
+        full, progress and token events are dropped; the final "complete"
+        or "error" event is always delivered.
+
+        Yields SSE-formatted progress events.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SSE_QUEUE_SIZE)
+
+        def put_final(event: Optional[Dict[str, Any]]) -> None:
+            # Terminal events never wait on the client; the oldest buffered
+            # progress updates make room for them instead
+            while True:
+                try:
+                    queue.put_nowait(event)
+                    return
+                except asyncio.QueueFull:
+                    queue.get_nowait()
+
+        async def produce() -> None:
+            error = None
+            try:
+                async for event in self._run_pipeline(
+                    db, topic, style, duration, research_depth, brand_voice,
+                    stream_tokens=True
+                ):
+                    if event["type"] == "complete":
+                        await queue.put(event)
+                    else:
+                        try:
+                            queue.put_nowait(event)
+                        except asyncio.QueueFull:
+                            pass
+            except asyncio.CancelledError:
+                error = "Script generation was cancelled"
+                raise
+            except Exception as e:
+                error = str(e)
+            finally:
+                # Always end the stream, so the consumer never waits forever
+                if error is not None:
+                    put_final({"type": "error", "message": error})
+                put_final(None)
+
+        producer = asyncio.create_task(produce())
+        try:
+            while True:
+                event = await queue.get()
+                if event is None:
+                    break
+                yield _format_sse(event)
+        finally:
+            # Stop generating if the client disconnected early, and wait for
+            # the pipeline to stop before the request's session is closed
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+
+    async def _run_pipeline(
+        self,
+        db: AsyncSession,
+        topic: str,
+        style: str,
+        duration: str,
+        research_depth: str,
+        brand_voice: str = None,
+        stream_tokens: bool = False
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Run research, script writing and persistence as a stream of events.
+
+        Both the buffered and the streaming endpoints drive this generator.
+        Events are progress updates, script tokens (when stream_tokens is
+        set) and a final "complete" event carrying the response data.
+        Failures are raised rather than yielded.
+        """
         # Validate inputs
         validate_topic(topic)
         validate_style(style)
@@ -69,14 +232,23 @@ class ScriptService:
         start_time = time.time()
         script_id = str(uuid.uuid4())
 
+        # Step 1: Research, started right away so the LLM call runs while
+        # progress events are delivered
+        logger.info("[%s] Starting research for: %s", script_id, topic)
+        research_task = asyncio.create_task(
+            self.researcher.research_topic(topic=topic, depth=research_depth)
+        )
+
         try:
-            # Step 1: Research
-            print(f"[{script_id}] Starting research for: {topic}")
+            yield {
+                "type": "progress",
+                "step": "research",
+                "message": "Searching the web for current information...",
+                "progress": 10
+            }
+
             try:
-                research_data = await self.researcher.research_topic(
-                    topic=topic,
-                    depth=research_depth
-                )
+                research_data = await research_task
             except Exception as e:
                 raise ResearchError(f"Research phase failed: {str(e)}")
 
@@ -84,15 +256,52 @@ class ScriptService:
             if not research_data or "error" in research_data:
                 raise ResearchError("Failed to gather sufficient research data")
 
-            # Step 2: Generate script
-            print(f"[{script_id}] Generating script...")
+            yield {
+                "type": "progress",
+                "step": "research",
+                "message": f"Found {len(research_data.get('sources', []))} sources",
+                "progress": 33
+            }
+
+            # Step 2: Analysis
+            yield {
+                "type": "progress",
+                "step": "analysis",
+                "message": "Analyzing research and synthesizing insights...",
+                "progress": 50
+            }
+
+            # Step 3: Generate script
+            logger.info("[%s] Generating script...", script_id)
+            yield {
+                "type": "progress",
+                "step": "writing",
+                "message": "Writing your professional YouTube script...",
+                "progress": 66
+            }
+
             try:
-                script_data = await self.scriptwriter.generate_script(
-                    research_data=research_data,
-                    style=style,
-                    duration=duration,
-                    brand_voice=brand_voice
-                )
+                if stream_tokens:
+                    # Forward script tokens as they are generated instead of
+                    # waiting for the full completion
+                    script_data = None
+                    async for chunk in self.scriptwriter.stream_script(
+                        research_data=research_data,
+                        style=style,
+                        duration=duration,
+                        brand_voice=brand_voice
+                    ):
+                        if isinstance(chunk, str):
+                            yield {"type": "token", "delta": chunk}
+                        else:
+                            script_data = chunk
+                else:
+                    script_data = await self.scriptwriter.generate_script(
+                        research_data=research_data,
+                        style=style,
+                        duration=duration,
+                        brand_voice=brand_voice
+                    )
             except Exception as e:
                 raise ScriptGenerationError(f"Script generation failed: {str(e)}")
 
@@ -100,198 +309,380 @@ class ScriptService:
             if not script_data or not script_data.get("full_script"):
                 raise ScriptGenerationError("Failed to generate valid script")
 
-            # Calculate total tokens
-            research_tokens = research_data.get("_meta", {}).get("tokens_used", {})
-            script_tokens = script_data.get("_meta", {}).get("tokens_used", {})
-
-            total_tokens = (
-                research_tokens.get("input_tokens", 0) +
-                research_tokens.get("output_tokens", 0) +
-                script_tokens.get("input_tokens", 0) +
-                script_tokens.get("output_tokens", 0)
-            )
+            yield {
+                "type": "progress",
+                "step": "writing",
+                "message": "Finalizing your script...",
+                "progress": 90
+            }
 
             generation_time = time.time() - start_time
 
-            # Step 3: Save to database
-            script_record = Script(
-                script_id=script_id,
-                topic=topic,
-                style=style,
-                duration=duration,
-                research_data=research_data,
-                sources=research_data.get("sources", []),
-                title=script_data.get("title"),
-                description=script_data.get("description"),
-                keywords=script_data.get("keywords", []),
-                full_script=script_data.get("full_script", ""),
-                script_sections=script_data.get("script", {}),
-                estimated_duration=script_data.get("estimated_duration"),
-                tone=script_data.get("tone"),
-                target_audience=script_data.get("target_audience"),
-                tokens_used=total_tokens,
-                generation_time=generation_time
+            # Step 4: Save to database
+            script_record = self._build_record(
+                script_id, topic, style, duration,
+                research_data, script_data, generation_time
             )
 
             db.add(script_record)
             await db.commit()
             await db.refresh(script_record)
 
-            print(f"[{script_id}] Script generated successfully in {generation_time:.2f}s")
-
-            # Build response
-            return self._build_response(script_record, research_data, script_data)
+            logger.info("[%s] Script generated successfully in %.2fs", script_id, generation_time)
 
         except Exception as e:
             await db.rollback()
-            print(f"[{script_id}] Error: {str(e)}")
+            logger.error("[%s] Error: %s", script_id, e)
             raise
 
-    async def generate_script_stream(
+        finally:
+            # Don't leave research running if the client went away early
+            research_task.cancel()
+
+        yield {
+            "type": "complete",
+            "message": "Script generated successfully!",
+            "progress": 100,
+            "data": self._build_response(script_record, research_data, script_data)
+        }
+
+    async def generate_scripts_bulk(
         self,
         db: AsyncSession,
-        topic: str,
-        style: str = "educational",
-        duration: str = "10-15 minutes",
-        research_depth: str = "medium",
-        brand_voice: str = None
-    ) -> AsyncGenerator[str, None]:
+        specs: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
         """
-        Stream script generation with real-time progress updates.
+        Generate several scripts concurrently and save them in one batch.
 
-        Yields SSE-formatted progress events.
+        Args:
+            db: Database session
+            specs: Generation requests, each with the generate_script arguments
+
+        Returns:
+            Summaries of saved scripts and any per-spec errors
         """
-        def format_sse(data: dict) -> str:
-            """Format data as Server-Sent Event."""
-            return f"data: {json.dumps(data)}\n\n"
+        results = await gather_bounded(
+            (self._generate_record(**spec) for spec in specs),
+            limit=BULK_CONCURRENCY
+        )
+        return await self._save_bulk(db, specs, results)
 
-        # Validate inputs
-        try:
-            validate_topic(topic)
-            validate_style(style)
-            validate_duration(duration)
-            validate_research_depth(research_depth)
-            validate_brand_voice(brand_voice)
-        except Exception as e:
-            yield format_sse({"type": "error", "message": str(e)})
-            return
+    async def start_batch_job(
+        self,
+        db: AsyncSession,
+        specs: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Generate scripts through the provider batch API in the background.
 
-        start_time = time.time()
-        script_id = str(uuid.uuid4())
+        Job status is stored in the database, so any worker can report it.
 
+        Args:
+            db: Database session
+            specs: Generation requests, each with the generate_script arguments
+
+        Returns:
+            The new job's status
+        """
+        job = BatchJob(job_id=str(uuid.uuid4()), status="pending", total=len(specs))
+        db.add(job)
+        await db.commit()
+
+        task = asyncio.create_task(self._run_batch_job(job.job_id, specs))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+        return job.to_dict()
+
+    async def get_batch_job(self, db: AsyncSession, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return a batch job's status and, once finished, its results."""
+        result = await db.execute(select(BatchJob).where(BatchJob.job_id == job_id))
+        job = result.scalar_one_or_none()
+        return job.to_dict() if job else None
+
+    async def stop_batch_jobs(self) -> None:
+        """
+        Cancel running batch jobs, e.g. at shutdown, and wait for them to stop.
+
+        Their provider batches are cancelled as well, so no unclaimed work
+        keeps being billed.
+        """
+        tasks = list(self._batch_tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _run_batch_job(self, job_id: str, specs: List[Dict[str, Any]]) -> None:
+        """Run a batch job with its own session, recording the outcome on the job."""
         try:
-            # Step 1: Research
-            yield format_sse({
-                "type": "progress",
-                "step": "research",
-                "message": "Searching the web for current information...",
-                "progress": 10
-            })
+            await self._update_batch_job(job_id, status="running")
+            async with AsyncSessionLocal() as db:
+                result = await self.generate_scripts_batch(db, specs)
+        except asyncio.CancelledError:
+            await self._update_batch_job(
+                job_id, status="failed", error="Interrupted by application shutdown"
+            )
+            raise
+        except Exception as e:
+            logger.error("Batch job %s failed: %s", job_id, e)
+            await self._update_batch_job(job_id, status="failed", error=str(e))
+        else:
+            await self._update_batch_job(job_id, status="completed", result=result)
 
-            try:
-                research_data = await self.researcher.research_topic(
-                    topic=topic,
-                    depth=research_depth
-                )
-            except Exception as e:
-                yield format_sse({"type": "error", "message": f"Research failed: {str(e)}"})
-                return
+    async def _update_batch_job(self, job_id: str, **values: Any) -> None:
+        """Write batch job fields in a short transaction of their own."""
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                update(BatchJob).where(BatchJob.job_id == job_id).values(**values)
+            )
+            await db.commit()
 
-            yield format_sse({
-                "type": "progress",
-                "step": "research",
-                "message": f"Found {len(research_data.get('sources', []))} sources",
-                "progress": 33
-            })
+    async def generate_scripts_batch(
+        self,
+        db: AsyncSession,
+        specs: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Research scripts concurrently, then write them all in one provider batch.
 
-            # Step 2: Analysis
-            yield format_sse({
-                "type": "progress",
-                "step": "analysis",
-                "message": "Analyzing research and synthesizing insights...",
-                "progress": 50
-            })
+        Batch requests cost half as much but can take hours, so this is
+        meant for background jobs rather than request handlers.
 
-            # Small delay to show analysis phase
-            await asyncio.sleep(0.5)
+        Args:
+            db: Database session
+            specs: Generation requests, each with the generate_script arguments
 
-            # Step 3: Script Generation
-            yield format_sse({
-                "type": "progress",
-                "step": "writing",
-                "message": "Writing your professional YouTube script...",
-                "progress": 66
-            })
+        Returns:
+            Summaries of saved scripts and any per-spec errors
+        """
+        start_time = time.time()
+        research: List[Union[Dict[str, Any], Exception]] = await gather_bounded(
+            (self._research_spec(**spec) for spec in specs),
+            limit=BULK_CONCURRENCY
+        )
 
-            try:
-                script_data = await self.scriptwriter.generate_script(
-                    research_data=research_data,
-                    style=style,
-                    duration=duration,
-                    brand_voice=brand_voice
+        # Specs whose research failed keep that error; every other slot is
+        # replaced below once its script is written
+        results: List[Union[Script, Exception]] = [
+            r if isinstance(r, Exception) else ScriptGenerationError("Script was not written")
+            for r in research
+        ]
+        pending = [i for i, r in enumerate(research) if not isinstance(r, Exception)]
+        if pending:
+            script_datas = await self.scriptwriter.generate_scripts_batch([
+                (
+                    research[i],
+                    specs[i].get("style", "educational"),
+                    specs[i].get("duration", "10-15 minutes"),
+                    specs[i].get("brand_voice")
                 )
-            except Exception as e:
-                yield format_sse({"type": "error", "message": f"Script generation failed: {str(e)}"})
-                return
+                for i in pending
+            ])
 
-            yield format_sse({
-                "type": "progress",
-                "step": "writing",
-                "message": "Finalizing your script...",
-                "progress": 90
-            })
+            generation_time = time.time() - start_time
+            for i, script_data in zip(pending, script_datas):
+                if not script_data.get("full_script"):
+                    results[i] = ScriptGenerationError(
+                        script_data.get("error", "Failed to generate valid script")
+                    )
+                    continue
+
+                results[i] = self._build_record(
+                    str(uuid.uuid4()), specs[i]["topic"],
+                    specs[i].get("style", "educational"),
+                    specs[i].get("duration", "10-15 minutes"),
+                    research[i], script_data, generation_time
+                )
 
-            # Calculate tokens
-            research_tokens = research_data.get("_meta", {}).get("tokens_used", {})
-            script_tokens = script_data.get("_meta", {}).get("tokens_used", {})
+        return await self._save_bulk(db, specs, results)
 
-            total_tokens = (
-                research_tokens.get("input_tokens", 0) +
-                research_tokens.get("output_tokens", 0) +
-                script_tokens.get("input_tokens", 0) +
-                script_tokens.get("output_tokens", 0)
-            )
+    async def _save_bulk(
+        self,
+        db: AsyncSession,
+        specs: List[Dict[str, Any]],
+        results: List[Union[Script, Exception]]
+    ) -> Dict[str, Any]:
+        """Save the generated records of a bulk request and summarize the outcome."""
+        records = [r for r in results if isinstance(r, Script)]
+        errors = [
+            {"topic": spec.get("topic"), "error": str(r)}
+            for spec, r in zip(specs, results)
+            if not isinstance(r, Script)
+        ]
 
-            generation_time = time.time() - start_time
+        try:
+            await self._save_records(db, records)
+        except Exception:
+            await db.rollback()
+            raise
+
+        return {
+            "scripts": [
+                {
+                    "script_id": r.script_id,
+                    "topic": r.topic,
+                    "title": r.title,
+                    "tokens_used": r.tokens_used,
+                    "generation_time": r.generation_time
+                }
+                for r in records
+            ],
+            "errors": errors
+        }
+
+    async def _research_spec(
+        self,
+        topic: str,
+        style: str = "educational",
+        duration: str = "10-15 minutes",
+        research_depth: str = "medium",
+        brand_voice: str = None
+    ) -> Union[Dict[str, Any], Exception]:
+        """Validate one bulk spec and research it, returning the research or the error."""
+        try:
+            validate_topic(topic)
+            validate_style(style)
+            validate_duration(duration)
+            validate_research_depth(research_depth)
+            validate_brand_voice(brand_voice)
 
-            # Save to database
-            script_record = Script(
-                script_id=script_id,
+            research_data = await self.researcher.research_topic(
                 topic=topic,
+                depth=research_depth
+            )
+            if not research_data or "error" in research_data:
+                raise ResearchError("Failed to gather sufficient research data")
+            return research_data
+
+        except Exception as e:
+            return e
+
+    async def _generate_record(
+        self,
+        topic: str,
+        style: str = "educational",
+        duration: str = "10-15 minutes",
+        research_depth: str = "medium",
+        brand_voice: str = None
+    ) -> Union[Script, Exception]:
+        """Research and write one script, returning an unsaved record or the error."""
+        start_time = time.time()
+        research_data = await self._research_spec(
+            topic, style, duration, research_depth, brand_voice
+        )
+        if isinstance(research_data, Exception):
+            return research_data
+
+        try:
+            script_data = await self.scriptwriter.generate_script(
+                research_data=research_data,
                 style=style,
                 duration=duration,
-                research_data=research_data,
-                sources=research_data.get("sources", []),
-                title=script_data.get("title"),
-                description=script_data.get("description"),
-                keywords=script_data.get("keywords", []),
-                full_script=script_data.get("full_script", ""),
-                script_sections=script_data.get("script", {}),
-                estimated_duration=script_data.get("estimated_duration"),
-                tone=script_data.get("tone"),
-                target_audience=script_data.get("target_audience"),
-                tokens_used=total_tokens,
-                generation_time=generation_time
+                brand_voice=brand_voice
             )
+            if not script_data or not script_data.get("full_script"):
+                raise ScriptGenerationError("Failed to generate valid script")
 
-            db.add(script_record)
-            await db.commit()
-            await db.refresh(script_record)
-
-            # Send completion
-            yield format_sse({
-                "type": "complete",
-                "message": "Script generated successfully!",
-                "progress": 100,
-                "data": self._build_response(script_record, research_data, script_data)
-            })
+            return self._build_record(
+                str(uuid.uuid4()), topic, style, duration,
+                research_data, script_data, time.time() - start_time
+            )
 
         except Exception as e:
-            await db.rollback()
-            yield format_sse({"type": "error", "message": str(e)})
+            return e
+
+    async def _save_records(self, db: AsyncSession, records: List[Script]) -> None:
+        """Insert script records with a single commit."""
+        if not records:
+            return
+
+        conn = await db.connection()
+        if len(records) >= COPY_THRESHOLD and conn.dialect.driver == "asyncpg":
+            # PostgreSQL COPY streams all rows in one protocol exchange;
+            # ids and timestamps come from the column defaults
+            # COPY bypasses SQLAlchemy, so apply the column types' bind
+            # processing (JSON encoding, compression) by hand
+            columns = Script.__table__.c
+            processors = [
+                columns[column].type.bind_processor(conn.dialect) for column in _COPY_COLUMNS
+            ]
+            raw = await conn.get_raw_connection()
+            await raw.driver_connection.copy_records_to_table(
+                Script.__tablename__,
+                records=[
+                    tuple(
+                        process(getattr(r, column)) if process else getattr(r, column)
+                        for column, process in zip(_COPY_COLUMNS, processors)
+                    )
+                    for r in records
+                ],
+                columns=_COPY_COLUMNS
+            )
+        else:
+            db.add_all(records)
+        await db.commit()
+
+    def _build_record(
+        self,
+        script_id: str,
+        topic: str,
+        style: str,
+        duration: str,
+        research_data: Dict[str, Any],
+        script_data: Dict[str, Any],
+        generation_time: float
+    ) -> Script:
+        """Build an unsaved Script row from research and script output."""
+        total_tokens = _tokens(research_data) + _tokens(script_data)
+
+        return Script(
+            script_id=script_id,
+            topic=topic,
+            style=style,
+            duration=duration,
+            research_data=research_data,
+            sources=research_data.get("sources", []),
+            title=script_data.get("title"),
+            description=script_data.get("description"),
+            keywords=script_data.get("keywords", []),
+            full_script=script_data.get("full_script", ""),
+            script_sections=script_data.get("script", {}),
+            estimated_duration=script_data.get("estimated_duration"),
+            tone=script_data.get("tone"),
+            target_audience=script_data.get("target_audience"),
+            tokens_used=total_tokens,
+            generation_time=generation_time
+        )
+
+    async def get_script(
+        self,
+        db: AsyncSession,
+        script_id: str,
+        verify: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Get script by ID.
+
+        Args:
+            db: Database session
+            script_id: Script identifier
+            verify: Confirm a cached script still exists, since another
+                worker may have deleted it; used before exports and refines
+
+        Returns:
+            Script data dict
+        """
+        # Callers get their own copy so mutations never reach the cache
+        cached = self._script_cache.get(script_id)
+        if cached is not None:
+            if verify:
+                exists = await db.execute(
+                    select(Script.id).where(Script.script_id == script_id)
+                )
+                if exists.scalar_one_or_none() is None:
+                    self.forget_script(script_id)
+                    raise ValueError(f"Script {script_id} not found")
+            return copy.deepcopy(cached)
 
-    async def get_script(self, db: AsyncSession, script_id: str) -> Dict[str, Any]:
-        """Get script by ID."""
         result = await db.execute(
             select(Script).where(Script.script_id == script_id)
         )
@@ -300,31 +691,70 @@ class ScriptService:
         if not script:
             raise ValueError(f"Script {script_id} not found")
 
-        return script.to_dict()
+        script_data = script.to_dict()
+        self._script_cache.set(script_id, script_data)
+        return copy.deepcopy(script_data)
+
+    def forget_script(self, script_id: str) -> None:
+        """Drop a script from the read cache, e.g. after it is deleted."""
+        self._script_cache.pop(script_id)
 
     async def list_scripts(
         self,
         db: AsyncSession,
         skip: int = 0,
-        limit: int = 10
+        limit: int = 10,
+        before: Optional[int] = None
     ) -> Dict[str, Any]:
-        """List all scripts with pagination."""
-        # Get total count
-        count_result = await db.execute(select(Script))
-        total = len(count_result.all())
+        """
+        List scripts newest first, paginated by offset or by cursor.
 
-        # Get paginated results
-        result = await db.execute(
-            select(Script)
-            .order_by(Script.created_at.desc())
-            .offset(skip)
+        Args:
+            db: Database session
+            skip: Number of scripts to skip (ignored when before is given)
+            limit: Maximum number of scripts to return
+            before: id of the last script on the previous page; the page
+                then starts right after it without an OFFSET scan, and
+                total counts the scripts from that point on
+
+        Returns:
+            Total count and the page of scripts
+        """
+        # Fetch the page and the total count in one statement, as plain
+        # column rows to skip ORM object construction and to_dict().
+        # id breaks ties between scripts created in the same second.
+        stmt = (
+            select(*_LIST_COLUMNS, func.count().over().label("_total"))
+            .order_by(Script.created_at.desc(), Script.id.desc())
             .limit(limit)
         )
-        scripts = result.scalars().all()
+        if before is not None:
+            cursor_time = select(Script.created_at).where(Script.id == before).scalar_subquery()
+            stmt = stmt.where(or_(
+                Script.created_at < cursor_time,
+                and_(Script.created_at == cursor_time, Script.id < before)
+            ))
+        else:
+            stmt = stmt.offset(skip)
+
+        result = await db.execute(stmt)
+        scripts = [dict(row) for row in result.mappings()]
+
+        if scripts:
+            total = scripts[0]["_total"]
+            for script in scripts:
+                del script["_total"]
+        elif skip and before is None:
+            # Past the last page the window count isn't returned; count directly
+            total = (
+                await db.execute(select(func.count()).select_from(Script))
+            ).scalar_one()
+        else:
+            total = 0
 
         return {
             "total": total,
-            "scripts": [s.to_dict() for s in scripts]
+            "scripts": scripts
         }
 
     def _build_response(
@@ -334,27 +764,22 @@ class ScriptService:
         script_data: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Build unified response from all data sources."""
-        script_sections = script_data.get("script", {})
+        sections = script_data.get("script")
+        if not isinstance(sections, dict):
+            sections = {}
 
-        return {
+        response = {
             "script_id": script_record.script_id,
             "topic": script_record.topic,
-            "title": script_data.get("title"),
-            "description": script_data.get("description"),
             "keywords": script_data.get("keywords", []),
 
             # Script structure
-            "hook": script_sections.get("hook") if isinstance(script_sections, dict) else None,
-            "intro": script_sections.get("intro") if isinstance(script_sections, dict) else None,
-            "body": script_sections.get("body", []) if isinstance(script_sections, dict) else [],
-            "conclusion": script_sections.get("conclusion") if isinstance(script_sections, dict) else None,
+            "hook": sections.get("hook"),
+            "intro": sections.get("intro"),
+            "body": sections.get("body", []),
+            "conclusion": sections.get("conclusion"),
             "full_script": script_data.get("full_script", ""),
 
-            # Metadata
-            "estimated_duration": script_data.get("estimated_duration"),
-            "tone": script_data.get("tone"),
-            "target_audience": script_data.get("target_audience"),
-
             # Research
             "sources": research_data.get("sources", []),
             "key_findings": research_data.get("key_findings", []),
@@ -365,3 +790,7 @@ class ScriptService:
 
             "created_at": script_record.created_at.isoformat()
         }
+        # Optional script metadata, None when the model left it out
+        for key in _SCRIPT_KEYS:
+            response[key] = script_data.get(key)
+        return response
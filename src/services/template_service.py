@@ -1,5 +1,6 @@
 """Template service for pre-made script templates."""
-from typing import Dict, List, Any
+from typing import Dict, Any, Tuple
+import orjson
 
 
 class TemplateService:
@@ -74,16 +75,44 @@ class TemplateService:
         }
     ]
 
-    def get_all_templates(self) -> List[Dict[str, Any]]:
+    # Read-only view of the templates and a lookup index by template ID
+    _ALL_TEMPLATES = tuple(TEMPLATES)
+    _INDEX = {template["id"]: template for template in TEMPLATES}
+
+    # Templates never change, so the list response is encoded once
+    _ALL_JSON = orjson.dumps({"templates": _ALL_TEMPLATES})
+
+    def __init__(self):
+        """Pre-encode each template's API response."""
+        self._template_json = {
+            template_id: orjson.dumps({
+                "template": template,
+                "settings": self.apply_template(template_id)
+            })
+            for template_id, template in self._INDEX.items()
+        }
+
+    def get_all_templates(self) -> Tuple[Dict[str, Any], ...]:
         """Get all available templates."""
-        return self.TEMPLATES
+        return self._ALL_TEMPLATES
+
+    def get_all_templates_json(self) -> bytes:
+        """Get the template list response as encoded JSON."""
+        return self._ALL_JSON
+
+    def get_template_json(self, template_id: str) -> bytes:
+        """Get a template and its form settings as encoded JSON."""
+        try:
+            return self._template_json[template_id]
+        except KeyError:
+            raise ValueError(f"Template {template_id} not found")
 
     def get_template(self, template_id: str) -> Dict[str, Any]:
         """Get specific template by ID."""
-        for template in self.TEMPLATES:
-            if template["id"] == template_id:
-                return template
-        raise ValueError(f"Template {template_id} not found")
+        try:
+            return self._INDEX[template_id]
+        except KeyError:
+            raise ValueError(f"Template {template_id} not found")
 
     def apply_template(
         self,
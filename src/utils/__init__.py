@@ -10,7 +10,10 @@ from src.utils.validators import (
     validate_style,
     validate_duration,
     validate_research_depth,
-    validate_brand_voice
+    validate_brand_voice,
+    is_valid_topic,
+    is_valid_style,
+    is_valid_duration
 )
 
 __all__ = [
@@ -22,5 +25,8 @@ __all__ = [
     "validate_style",
     "validate_duration",
     "validate_research_depth",
-    "validate_brand_voice"
+    "validate_brand_voice",
+    "is_valid_topic",
+    "is_valid_style",
+    "is_valid_duration"
 ]
@@ -0,0 +1,22 @@
+"""CORS handling scoped to the JSON API."""
+from starlette.middleware.cors import CORSMiddleware
+from starlette.types import Receive, Scope, Send
+
+
+class APICORSMiddleware(CORSMiddleware):
+    """CORSMiddleware that only runs for paths under a prefix.
+
+    Server-rendered pages are same-origin, so they skip the origin checks
+    and header rewriting entirely. Allowed-header values are still
+    precomputed once by CORSMiddleware.__init__.
+    """
+
+    def __init__(self, app, path_prefix: str = "/api", **kwargs):
+        super().__init__(app, **kwargs)
+        self.path_prefix = path_prefix
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"].startswith(self.path_prefix):
+            await super().__call__(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
@@ -0,0 +1,62 @@
+"""Application logging that keeps stream I/O off the event loop."""
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+# Root of the application's logger hierarchy (src.main, src.services...)
+APP_LOGGER = "src"
+
+_listener: Optional[QueueListener] = None
+_handler: Optional[QueueHandler] = None
+
+
+def start_logging(level: int = logging.INFO) -> None:
+    """
+    Route application log records through a queue.
+
+    Request handlers only enqueue records; a background thread formats
+    them and writes to stderr, so a slow terminal or pipe never blocks
+    the event loop.
+
+    Args:
+        level: Minimum level emitted by application loggers
+    """
+    global _listener, _handler
+    if _listener is not None:
+        return
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    _handler = QueueHandler(log_queue)
+    logger = logging.getLogger(APP_LOGGER)
+    logger.setLevel(level)
+    logger.addHandler(_handler)
+    logger.propagate = False
+
+    _listener = QueueListener(log_queue, handler)
+    _listener.start()
+
+
+def stop_logging() -> None:
+    """
+    Flush queued records, stop the background writer and detach the queue.
+
+    Records logged afterwards propagate to the root logger as usual, and a
+    later start_logging() installs a fresh handler instead of a second one.
+    """
+    global _listener, _handler
+    if _listener is None:
+        return
+
+    logger = logging.getLogger(APP_LOGGER)
+    logger.removeHandler(_handler)
+    logger.propagate = True
+    _handler = None
+
+    _listener.stop()
+    _listener = None
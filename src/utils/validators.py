@@ -1,7 +1,61 @@
 """Input validation utilities."""
-from typing import Optional
+import re
+from typing import Final, FrozenSet, Optional, Pattern, Tuple
 from src.utils.exceptions import ValidationError
 
+# Allowed values, kept in display order for error messages
+VALID_STYLES: Final[Tuple[str, ...]] = ("educational", "entertaining", "inspirational")
+VALID_DURATIONS: Final[Tuple[str, ...]] = (
+    "5-8 minutes",
+    "8-10 minutes",
+    "10-15 minutes",
+    "15-20 minutes",
+    "20-30 minutes"
+)
+VALID_DEPTHS: Final[Tuple[str, ...]] = ("quick", "medium", "deep")
+
+_STYLE_SET: Final[FrozenSet[str]] = frozenset(VALID_STYLES)
+_DURATION_SET: Final[FrozenSet[str]] = frozenset(VALID_DURATIONS)
+_DEPTH_SET: Final[FrozenSet[str]] = frozenset(VALID_DEPTHS)
+
+# Topic length bounds, in characters
+MIN_TOPIC_LENGTH: Final = 5
+MAX_TOPIC_LENGTH: Final = 500
+
+# Common spam patterns, matched in a single pass
+_SPAM_RE: Final[Pattern[str]] = re.compile(r"http://|https://|www\.|buy now|click here", re.IGNORECASE)
+
+
+def _topic_error(topic: str) -> Optional[str]:
+    """Return why a topic is invalid, or None if it is valid."""
+    if not topic or len(topic.strip()) < MIN_TOPIC_LENGTH:
+        return f"Topic must be at least {MIN_TOPIC_LENGTH} characters long"
+
+    if len(topic) > MAX_TOPIC_LENGTH:
+        return f"Topic cannot exceed {MAX_TOPIC_LENGTH} characters"
+
+    # Check for common spam patterns
+    match = _SPAM_RE.search(topic)
+    if match:
+        return f"Topic contains invalid pattern: {match.group(0).lower()}"
+
+    return None
+
+
+def is_valid_topic(topic: str) -> bool:
+    """Check a topic without raising."""
+    return _topic_error(topic) is None
+
+
+def is_valid_style(style: str) -> bool:
+    """Check a style without raising."""
+    return style in _STYLE_SET
+
+
+def is_valid_duration(duration: str) -> bool:
+    """Check a duration without raising."""
+    return duration in _DURATION_SET
+
 
 def validate_topic(topic: str) -> None:
     """
@@ -13,18 +67,9 @@ def validate_topic(topic: str) -> None:
     Raises:
         ValidationError: If validation fails
     """
-    if not topic or len(topic.strip()) < 5:
-        raise ValidationError("Topic must be at least 5 characters long")
-
-    if len(topic) > 500:
-        raise ValidationError("Topic cannot exceed 500 characters")
-
-    # Check for common spam patterns
-    spam_patterns = ["http://", "https://", "www.", "buy now", "click here"]
-    topic_lower = topic.lower()
-    for pattern in spam_patterns:
-        if pattern in topic_lower:
-            raise ValidationError(f"Topic contains invalid pattern: {pattern}")
+    error = _topic_error(topic)
+    if error:
+        raise ValidationError(error)
 
 
 def validate_style(style: str) -> None:
@@ -37,9 +82,8 @@ def validate_style(style: str) -> None:
     Raises:
         ValidationError: If validation fails
     """
-    valid_styles = ["educational", "entertaining", "inspirational"]
-    if style not in valid_styles:
-        raise ValidationError(f"Style must be one of: {', '.join(valid_styles)}")
+    if not is_valid_style(style):
+        raise ValidationError(f"Style must be one of: {', '.join(VALID_STYLES)}")
 
 
 def validate_duration(duration: str) -> None:
@@ -52,15 +96,8 @@ def validate_duration(duration: str) -> None:
     Raises:
         ValidationError: If validation fails
     """
-    valid_durations = [
-        "5-8 minutes",
-        "8-10 minutes",
-        "10-15 minutes",
-        "15-20 minutes",
-        "20-30 minutes"
-    ]
-    if duration not in valid_durations:
-        raise ValidationError(f"Duration must be one of: {', '.join(valid_durations)}")
+    if not is_valid_duration(duration):
+        raise ValidationError(f"Duration must be one of: {', '.join(VALID_DURATIONS)}")
 
 
 def validate_research_depth(depth: str) -> None:
@@ -73,9 +110,8 @@ def validate_research_depth(depth: str) -> None:
     Raises:
         ValidationError: If validation fails
     """
-    valid_depths = ["quick", "medium", "deep"]
-    if depth not in valid_depths:
-        raise ValidationError(f"Research depth must be one of: {', '.join(valid_depths)}")
+    if depth not in _DEPTH_SET:
+        raise ValidationError(f"Research depth must be one of: {', '.join(VALID_DEPTHS)}")
 
 
 def validate_brand_voice(brand_voice: Optional[str]) -> None: